@@ -30,12 +30,21 @@ class Auto_Scroll_Frame(tk.Frame):
         window=self.scrollframe,
         anchor="nw")
 
+    self._update_scheduled = False # whether an update of the scrollregion is already scheduled
     self.scrollframe.bind("<Configure>", self._on_configure)
     self.master.bind("<Configure>", self._on_configure)
     self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
 
   def _on_configure(self, event: tk.Event = None):
-    """Update the scrollbar and canvas when the size of the frame changes"""
+    """Schedule an update of the scrollbar and canvas when the size of the frame changes. Bursts of events (e.g. while many widgets are added) only cause a single update once Tk is idle."""
+    if self._update_scheduled:
+      return
+    self._update_scheduled = True
+    self.after_idle(self._update_scrollregion)
+
+  def _update_scrollregion(self):
+    """Update the scrollbar and canvas to the current size of the frame"""
+    self._update_scheduled = False
     # restrict height of scrollframe to height of parent
     height = min(self.scrollframe.winfo_height(), self.master.winfo_height())
     width = self.scrollframe.winfo_width()
@@ -4,35 +4,40 @@ This module implements a class to handle drag and drop events for matplotlib art
 It also provides tools to find a particle associated to that artist.
 """
 from typing import List, Tuple
+import math
 
 import numpy as np
+from scipy.spatial import cKDTree
 import matplotlib.pyplot as plt
 import matplotlib.transforms as transforms
 from matplotlib.image import AxesImage
 from matplotlib.patches import Circle, Rectangle
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backend_bases import PickEvent, MouseEvent
+from matplotlib.backend_bases import PickEvent, MouseEvent, DrawEvent
 
 from graph_particle import Graph_Particle
 from particle_edge import Particle_Edge
 
+_EMPTY_INDICES: np.ndarray = np.empty(0, dtype=np.int32)
+
 class Drag_Handler:
+  # offsets of the 3x3 block of cells around a cell
+  _NEIGHBOR_OFFSETS: Tuple[Tuple[int, int]] = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
   def __init__(self,
       canvas: FigureCanvasTkAgg,
       axis: plt.Axes,
       particle_list: List[Graph_Particle],
-      particle_cell_list: List[List[int]] = None,
       cell_size: float = None,
-      max_pick_range: float = 0.2):
+      max_pick_range: float = 2.):
     """
     Initialize the Drag_Handler object.
-    if a cell list is provided, the cell size must also be provided. When both are provided, the handler will use the cell list to find the particle associated to the artist more efficiently.
+    If a cell size is provided, the handler sorts the particles into a grid of cells with that size (spatial hash) and uses it to find the particle associated to the artist. Otherwise a KD-tree is used.
 
     Args:
       canvas (FigureCanvasTkAgg): The canvas to which the artists are drawn.
       particle_list (List[Graph_Particle]): The list of particles to which the artists are associated.
-      particle_cell_list (List[List[int]], optional): a grid of cells and the particles in each cell as references to `particle_list`. Defaults to None.
-      cell_size (float, optional): The size of the cells in the cell list. Defaults to None.
+      cell_size (float, optional): The size of the cells in the cell grid. Should be at least `max_pick_range`. Defaults to None (use KD-tree instead).
       max_pick_range (float, optional): The maximum distance from the mouse click to the artist's center that will be considered a pick. Defaults to 2.
     
     """
@@ -40,22 +45,29 @@ class Drag_Handler:
     self.ax = axis
     self.particle_list = particle_list
     self.max_pick_range = max_pick_range
-    self.particle_cell_list = None
-    # if a cell list is provided, the cell size must also be provided
-    if particle_cell_list is None or cell_size is None:
-      self.use_cell_list: bool = False
-    else:
-      self.use_cell_list: bool = True
-      self.particle_cell_list = particle_cell_list
-      self.cell_size = cell_size
+    self.use_cell_list: bool = cell_size is not None
+    self.cell_size: float = cell_size
+
+    # cache particle positions in a cell grid or KD-tree for fast lookup of the particle associated to a picked artist
+    self._positions: np.ndarray = None # (N, 2) array of particle positions, same order as `particle_list`
+    self._kdtree: cKDTree = None
+    self.cell_map: dict[Tuple[int, int], np.ndarray] = {} # indices of the particles in each cell, keyed by cell coordinates
+    self.update_positions()
 
     self.cid_1: int = None # the id of the motion event
     self.cid_2: int = None # the id of the release event
     self.cid_3: int = None # the id of the scroll event
+    self.cid_4: int = None # the id of the draw event while an artist is dragged
     self.current_artist: plt.Artist = None # the artist that is currently being dragged
     self.current_particle: Graph_Particle = None # the particle associated to the artist that is currently being dragged
     self.pick_id = self.canvas.mpl_connect("pick_event", self.on_pick)
-    self.click_offset: np.ndarray = None # the offset between the mouse click and the artist's center
+    self.click_offset: Tuple[float, float] = None # the offset between the mouse click and the artist's center
+    self._half_size: Tuple[float, float] = None # half width and height of the dragged artist (only used for images)
+    self._background = None # cached canvas without the dragged artist, used for blitting
+    self._pending_rotation_steps: float = 0 # scroll steps that have not been applied to the artist yet
+    self._rotation_scheduled: bool = False # whether applying the pending rotation is already scheduled
+    self._last_motion_xy: Tuple[float, float] = None # mouse position of the last handled motion event in pixels
+    self._rotation_transform: transforms.Affine2D = None # rotation of the dragged artist, reused for all scroll events of one drag
     print("Drag handler initialized.")
 
   def update_particle_list(self, particle_list: List[Graph_Particle]):
@@ -66,6 +78,100 @@ class Drag_Handler:
       particle_list (List[Graph_Particle]): The new particle list.
     """
     self.particle_list = particle_list
+    self.update_positions()
+
+  def update_positions(self, positions: np.ndarray = None):
+    """
+    Rebuild the cached particle positions and the cell grid or KD-tree used to find the particle associated to a picked artist.
+    This needs to be called whenever particles were moved or added/removed.
+
+    Args:
+      positions (np.ndarray, optional): (N, 2) array of the current particle positions. If None, the positions are read from the particles. Defaults to None.
+    """
+    if positions is None:
+      positions = self.get_current_positions()
+    self._positions = positions
+    if self.use_cell_list:
+      self.update_cell_map()
+    else:
+      self._kdtree = cKDTree(self._positions)
+
+  def get_current_positions(self) -> np.ndarray:
+    """
+    Read the current positions of all particles in `self.particle_list`.
+
+    Returns:
+        np.ndarray: (N, 2) array of particle positions, same order as `particle_list`.
+    """
+    return np.array(
+        [particle.position for particle in self.particle_list],
+        dtype=np.float64).reshape(-1, 2)
+
+  def update_cell_map(self):
+    """
+    Sort the cached particle positions into a grid of cells with size `self.cell_size`. Each cell stores the indices of its particles (referring to `self.particle_list`).
+    """
+    cell_coordinates = np.floor(self._positions / self.cell_size).astype(np.int64)
+    cell_lists: dict[Tuple[int, int], List[int]] = {}
+    for particle_index, cell in enumerate(map(tuple, cell_coordinates.tolist())):
+      cell_lists.setdefault(cell, []).append(particle_index)
+    self.cell_map = {cell: np.array(indices, dtype=np.int32) for cell, indices in cell_lists.items()}
+
+  def find_particle(self, event_position: np.ndarray) -> Graph_Particle:
+    """
+    Find the particle closest to the given position within `self.max_pick_range` using the cached cell grid or KD-tree.
+    The cached positions of all particles are compared to their current positions first. If any particle was moved by other means than this handler (e.g. by the simulation or when editing a particle), the cache is rebuilt before the query.
+
+    Args:
+        event_position (np.ndarray): position of the click event or artist center.
+
+    Returns:
+        Graph_Particle: the closest particle or None if no particle is close enough.
+    """
+    if len(self.particle_list) == 0:
+      return None
+    # check that the cached positions of all particles are still up to date
+    positions = self.get_current_positions()
+    if not np.array_equal(positions, self._positions):
+      self.update_positions(positions)
+    if self.use_cell_list:
+      index = self.find_closest_cell_particle(event_position)
+      if index is None:
+        return None
+    else:
+      distance, index = self._kdtree.query(event_position, k=1, distance_upper_bound=self.max_pick_range)
+      if not np.isfinite(distance):
+        return None
+    return self.particle_list[index]
+
+  def find_closest_cell_particle(self, event_position: np.ndarray) -> int:
+    """
+    Find the index of the particle closest to the given position within `self.max_pick_range` using the cell grid.
+    The cell containing the position is searched first. The surrounding cells are only searched if they can contain a closer particle, i.e. if the nearest border of the cell is closer than the best match found so far.
+
+    Args:
+        event_position (np.ndarray): position of the click event or artist center.
+
+    Returns:
+        int: index of the closest particle in `self.particle_list` or None if no particle is close enough.
+    """
+    max_squared_distance: float = self.max_pick_range**2
+    cell_x = int(np.floor(event_position[0] / self.cell_size))
+    cell_y = int(np.floor(event_position[1] / self.cell_size))
+    home_indices = self.cell_map.get((cell_x, cell_y), _EMPTY_INDICES)
+    closest_index, min_squared_distance = _find_closest_index(event_position, home_indices, self._positions)
+    # distance from the event position to the nearest border of its cell
+    offset_x = event_position[0] - cell_x * self.cell_size
+    offset_y = event_position[1] - cell_y * self.cell_size
+    border_distance = min(offset_x, self.cell_size - offset_x, offset_y, self.cell_size - offset_y)
+    if min(min_squared_distance, max_squared_distance) > border_distance * border_distance:
+      closest_index, min_squared_distance = _find_closest_index(
+          event_position,
+          self.find_cell_particles(event_position),
+          self._positions)
+    if min_squared_distance < max_squared_distance:
+      return closest_index
+    return None
 
   def on_pick(self, event: PickEvent):
     """
@@ -88,6 +194,9 @@ class Drag_Handler:
     # Get the artist that was picked
     self.current_artist = event.artist
     self.new_rotation_deg = 0
+    self._pending_rotation_steps = 0
+    self._last_motion_xy = None
+    self._rotation_transform = None
     # ignore clicks on artistts not without group id "movable"
     if self.current_artist.get_gid() != "movable":
       print(f"Abort moving artist: {self.current_artist} with gid {self.current_artist.get_gid()}.")
@@ -96,7 +205,10 @@ class Drag_Handler:
     # get the center of the artist
     artist_center = get_artist_center(self.current_artist)
     # get mouse event coordinates in axees
-    self.click_offset = np.array([event.mouseevent.xdata - artist_center[0], event.mouseevent.ydata - artist_center[1]], dtype=np.float16)
+    self.click_offset = (
+        float(event.mouseevent.xdata - artist_center[0]),
+        float(event.mouseevent.ydata - artist_center[1]))
+    self._half_size = get_artist_half_size(self.current_artist)
     # Bind the motion and button release events to the canvas
     self.cid_1 = self.canvas.mpl_connect("motion_notify_event", self.on_motion)
     self.cid_2 = self.canvas.mpl_connect("button_release_event", self.on_release)
@@ -108,11 +220,7 @@ class Drag_Handler:
     # print(f"artist center: {artist_center}")
 
     # find the particle associated to the artist
-    if self.use_cell_list:
-      potential_particles = self.find_cell_particles(artist_center)
-      self.current_particle = find_particle_in_list(artist_center, potential_particles)
-    else:
-      self.current_particle = find_particle_in_list(artist_center, self.particle_list)
+    self.current_particle = self.find_particle(artist_center)
     if self.current_particle is None:
       print(f"Warning: no particle found for {type(self.current_artist)} at {artist_center}")
       self.current_artist = None
@@ -120,39 +228,101 @@ class Drag_Handler:
     print(f"picked particle at {self.current_particle.position}")
     if isinstance(self.current_particle, Particle_Edge):
       print(f"Picked particle for dragging: {self.current_particle.get_id()} ({self.current_particle.location_1_name}, {self.current_particle.location_2_name}, {self.current_particle.path_index}).")
+    # exclude the dragged artist from regular draws, it is blitted onto a cached background instead
+    self.current_artist.set_animated(True)
+    self._background = None
+    # full redraws during the drag (e.g. resizing) would hide the animated artist, so it is blitted again after each of them
+    self.cid_4 = self.canvas.mpl_connect("draw_event", self.on_draw)
+    # render the background and show the artist right away, not only after the first motion event
+    self.blit_current_artist()
     self.canvas.mpl_disconnect(self.pick_id)
 
   def on_motion(self, event: MouseEvent):
     """
     This function is called when the mouse is moved while a button is pressed.
-    It moves the artist to the mouse position.
+    It moves the artist to the mouse position. Events where the mouse moved by less than a pixel are ignored.
 
     Args:
       event (matplotlib.backend_bases.MouseEvent): The mouse event.
     """
     if event.inaxes:
+      if self._last_motion_xy is not None:
+        last_x, last_y = self._last_motion_xy
+        if abs(event.x - last_x) + abs(event.y - last_y) < 1:
+          return
+      self._last_motion_xy = (event.x, event.y)
       set_artist_position(
           self.current_artist,
-          np.array([event.xdata - self.click_offset[0], event.ydata - self.click_offset[1]], dtype=np.float16)
+          (event.xdata - self.click_offset[0], event.ydata - self.click_offset[1]),
+          half_size=self._half_size,
       )
       # print(f"Dragged particle {self.current_particle.get_id()}: ({self.current_particle.location_1_name}, {self.current_particle.location_2_name}, {self.current_particle.path_index})")
-      self.canvas.draw_idle()
+      self.blit_current_artist()
+
+  def blit_current_artist(self):
+    """
+    Redraw only the dragged artist on top of a cached background instead of redrawing the whole canvas.
+    The background is rendered (without the animated artist) when the artist is picked and after every full redraw of the canvas (see `on_draw`).
+    """
+    if self.current_artist is None:
+      return
+    if self._background is None:
+      self.canvas.draw() # triggers `on_draw`, which saves the background and blits the artist
+      if self._background is not None:
+        return
+      self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+    self.canvas.restore_region(self._background)
+    self.ax.draw_artist(self.current_artist)
+    self.canvas.blit(self.ax.bbox)
+
+  def on_draw(self, event: DrawEvent):
+    """
+    This function is called after every full redraw of the canvas while an artist is dragged.
+    The redraw does not include the animated artist, so the new background is saved and the artist is blitted on top of it.
+
+    Args:
+      event (matplotlib.backend_bases.DrawEvent): The draw event.
+    """
+    if self.current_artist is None:
+      return
+    self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+    self.ax.draw_artist(self.current_artist)
+    self.canvas.blit(self.ax.bbox)
 
   def on_scroll(self, event: MouseEvent):
     """
     This function is called when the mouse wheel is scrolled.
     It rotates the current artist by 1° per scroll step.
+    Scroll steps are accumulated and applied once the Tk event loop is idle, so a burst of scroll events only causes a single update of the artist.
 
     Args:
       event (matplotlib.backend_bases.MouseEvent): The mouse scroll event.
     """
     if event.inaxes:
-      ax = event.inaxes
-      self.new_rotation_deg += event.step
-      self.new_rotation_deg %= 360
-      set_artist_rotation(self.current_artist, self.new_rotation_deg, ax.transData)
-      # print(f"Rotated particle {self.current_particle.get_id()}: ({self.current_particle.location_1_name}, {self.current_particle.location_2_name}, {self.current_particle.path_index})")
-      self.canvas.draw_idle()
+      self._pending_rotation_steps += event.step
+      if not self._rotation_scheduled:
+        self._rotation_scheduled = True
+        self.canvas.get_tk_widget().after_idle(self.apply_pending_rotation)
+
+  def apply_pending_rotation(self):
+    """
+    Rotate the current artist by all scroll steps accumulated since the last update and redraw it.
+    """
+    self._rotation_scheduled = False
+    pending_rotation_steps = self._pending_rotation_steps
+    self._pending_rotation_steps = 0
+    if self.current_artist is None or pending_rotation_steps == 0:
+      return
+    self.new_rotation_deg += pending_rotation_steps
+    self.new_rotation_deg %= 360
+    self._rotation_transform = set_artist_rotation(
+        self.current_artist,
+        self.new_rotation_deg,
+        self.ax.transData,
+        rotation_transform=self._rotation_transform,
+    )
+    # print(f"Rotated particle {self.current_particle.get_id()}: ({self.current_particle.location_1_name}, {self.current_particle.location_2_name}, {self.current_particle.path_index})")
+    self.blit_current_artist()
 
   def on_release(self, event):
     """
@@ -171,24 +341,34 @@ class Drag_Handler:
     if self.cid_3 is not None:
       self.canvas.mpl_disconnect(self.cid_3)
       self.cid_3 = None
+    if self.cid_4 is not None:
+      self.canvas.mpl_disconnect(self.cid_4)
+      self.cid_4 = None
 
+    # apply scroll steps that are still waiting for the idle callback
+    self.apply_pending_rotation()
+    self._background = None
+    if self.current_artist is not None:
+      self.current_artist.set_animated(False)
     # update the particle's position
     if self.current_particle is not None:
       # print(f"Released particle {self.current_particle.get_id()}: ({self.current_particle.location_1_name}, {self.current_particle.location_2_name}, {self.current_particle.path_index})")
-      new_rotation_rad = np.deg2rad(self.new_rotation_deg)
+      new_rotation_rad = math.radians(self.new_rotation_deg)
       old_rotation_rad = self.current_particle.get_rotation()
       self.current_particle.set_rotation(old_rotation_rad + new_rotation_rad)
       artist_center = get_artist_center(self.current_artist)
       self.current_particle.set_position(artist_center)
       self.current_particle.erase()
       self.current_particle.draw(self.ax)
+      self.update_positions()
 
       self.current_artist = None
       self.current_particle = None
       self.pick_id = self.canvas.mpl_connect('pick_event', self.on_pick)
+      self.canvas.draw_idle()
 
 
-  def find_cell_particles(self, event_position: np.ndarray) -> List[Graph_Particle]:
+  def find_cell_particles(self, event_position: np.ndarray) -> np.ndarray:
     """
     Find all particles that can possibly be associated to the click event.
     The particles are found in the cell that contains the click event and in the surrounding cells.
@@ -197,51 +377,95 @@ class Drag_Handler:
         event_position (np.ndarray): position of the click event.
 
     Returns:
-        List[Graph_Particle]: list of particles that can be associated to the click event.
+        np.ndarray: indices of the particles (referring to `self.particle_list`) that can be associated to the click event.
     """
     # TODO: refactor Cell list code into separate module
     # find the cell that contains the click event
-    cell_x = int(event_position[0] / self.cell_size)
-    cell_y = int(event_position[1] / self.cell_size)
+    cell_x = int(np.floor(event_position[0] / self.cell_size))
+    cell_y = int(np.floor(event_position[1] / self.cell_size))
     # find the particles in the cell and the surrounding cells
-    potential_particles = []
-    for i in range(cell_x - 1, cell_x + 2):
-      for j in range(cell_y - 1, cell_y + 2):
-        if i >= 0 and j >= 0 and i < len(self.particle_cell_list) and j < len(self.particle_cell_list[0]):
-          potential_particles.extend(self.particle_cell_list[i][j])
-    # convert the list of indices to a list of particles
-    return [self.particle_list[i] for i in potential_particles]
-
+    cell_map_get = self.cell_map.get
+    potential_particles = [cell_map_get((cell_x + dx, cell_y + dy)) for dx, dy in self._NEIGHBOR_OFFSETS]
+    potential_particles = [cell_particles for cell_particles in potential_particles if cell_particles is not None]
+    if not potential_particles:
+      return _EMPTY_INDICES
+    return np.concatenate(potential_particles)
 
 
-def find_particle_in_list(event_position: np.ndarray, particle_list: List[Graph_Particle], color: str=None, max_pick_range: float = 2.) -> Graph_Particle:
+def find_particle_in_list(event_position: np.ndarray, particle_list: List[Graph_Particle], color: str=None, max_pick_range: float = 2., positions: np.ndarray = None) -> Graph_Particle:
     """
     Find the particle associated to the artist in the list of particles.
     Choose the particle that is closest to the click event but within the maximum pick range.
+    Distances to all particles are calculated at once using numpy.
 
     Args:
       event_position (List[float]): The position of the click event.
       particle_list (List[Graph_Particle]): The list of particles to search in.
       color (str): The color of the artist. If None, the color is ignored, otherwise the color of the particle must match the given color. Defaults to None.
       max_pick_range (float): The maximum distance between the click event and the particle. Defaults to 2.
+      positions (np.ndarray, optional): (N, 2) array of the positions of the particles in `particle_list`. If None, the positions are read from the particles. Defaults to None.
 
     Returns:
       Graph_Particle: The particle associated to the artist.
     """
     # TODO: refactor particle finding code into separate module
-    min_distance = np.inf
-    for particle in particle_list:
-      if color is not None and particle.color != color:
-        continue # ignore particles with wrong color
-      distance = np.linalg.norm(particle.position - event_position)
-      if distance < min_distance:
-        min_distance = distance
-        closest_particle = particle
-    if min_distance < max_pick_range:
-      return closest_particle
+    if len(particle_list) == 0:
+      return None
+    if positions is None:
+      positions = np.array([particle.position for particle in particle_list], dtype=np.float64)
+    if color is not None:
+      color_indices = np.flatnonzero([particle.color == color for particle in particle_list])
+      return find_particle_in_indices(event_position, color_indices, positions, particle_list, max_pick_range)
+    difference = positions - event_position
+    squared_distances = np.einsum("ij,ij->i", difference, difference)
+    closest_index = int(np.argmin(squared_distances))
+    if squared_distances[closest_index] < max_pick_range**2:
+      return particle_list[closest_index]
     return None # if no particle is close enough
 
 
+def find_particle_in_indices(event_position: np.ndarray, indices: np.ndarray, positions: np.ndarray, particle_list: List[Graph_Particle], max_pick_range: float = 2.) -> Graph_Particle:
+    """
+    Find the particle closest to the click event among the particles with the given indices, but within the maximum pick range.
+    Only the positions of these particles are read from `positions`, so no filtered list of particles needs to be built.
+
+    Args:
+      event_position (np.ndarray): The position of the click event.
+      indices (np.ndarray): indices of the particles to search in (referring to `particle_list` and `positions`).
+      positions (np.ndarray): (N, 2) array of the positions of all particles in `particle_list`.
+      particle_list (List[Graph_Particle]): The list of all particles.
+      max_pick_range (float): The maximum distance between the click event and the particle. Defaults to 2.
+
+    Returns:
+      Graph_Particle: The closest particle or None if no particle is close enough.
+    """
+    closest_index, min_squared_distance = _find_closest_index(event_position, indices, positions)
+    if min_squared_distance < max_pick_range**2:
+      return particle_list[closest_index]
+    return None # if no particle is close enough
+
+
+def _find_closest_index(event_position: np.ndarray, indices: np.ndarray, positions: np.ndarray) -> Tuple[int, float]:
+    """
+    Find the particle closest to `event_position` among the particles with the given indices.
+
+    Args:
+      event_position (np.ndarray): The position of the click event.
+      indices (np.ndarray): indices of the particles to search in.
+      positions (np.ndarray): (N, 2) array of all particle positions.
+
+    Returns:
+      int: index of the closest particle or None if `indices` is empty.
+      float: squared distance to the closest particle (`np.inf` if `indices` is empty).
+    """
+    if len(indices) == 0:
+      return None, np.inf
+    difference = positions[indices] - event_position
+    squared_distances = np.einsum("ij,ij->i", difference, difference)
+    closest_index = int(np.argmin(squared_distances))
+    return int(indices[closest_index]), float(squared_distances[closest_index])
+
+
 def get_artist_center(artist) -> np.ndarray:
     """
     Get the center of the artist. Currently supported artist types: Circle, Rectangle, AxesImage.
@@ -254,26 +478,58 @@ def get_artist_center(artist) -> np.ndarray:
     """
     # if artist is a circle, get its center
     if isinstance(artist, (Circle, Rectangle)):
-      artist_center: np.ndarray = artist.get_center()
+      artist_center: np.ndarray = np.asarray(artist.get_center(), dtype=np.float64)
     # if artist is an image, get its center
     elif isinstance(artist, AxesImage):
-      artist_extent: Tuple[float] = artist.get_extent()
-      artist_center: np.ndarray = \
-          np.array([artist_extent[0], artist_extent[2]], dtype=np.float16) + \
-          np.array([artist_extent[1] - artist_extent[0], artist_extent[3] - artist_extent[2]], dtype=np.float16) / 2
+      artist_center: np.ndarray = np.array(get_image_center(artist))
     else:
       print(f"Warning: unknown artist type: {type(artist)}")
       return
     return artist_center
 
 
-def set_artist_position(artist: plt.Artist, position: np.ndarray) -> None:
+def get_image_center(artist: AxesImage) -> Tuple[float, float]:
+  """
+  Get the center of an image artist as a tuple. The center is memoized on the artist as `_cached_center` and cleared by `set_artist_position()` whenever the artist is moved.
+
+  Args:
+      artist (AxesImage): the image artist
+
+  Returns:
+      Tuple[float, float]: the center of the image's extent
+  """
+  center = getattr(artist, "_cached_center", None)
+  if center is None:
+    extent = artist.get_extent()
+    center = ((extent[0] + extent[1]) * 0.5, (extent[2] + extent[3]) * 0.5)
+    artist._cached_center = center
+  return center
+
+
+def get_artist_half_size(artist: plt.Artist) -> Tuple[float, float]:
+  """
+  Get half the width and height of an image artist's extent. This stays the same while the artist is dragged, so it only needs to be calculated once per pick.
+
+  Args:
+      artist (plt.Artist): the artist
+
+  Returns:
+      Tuple[float, float]: half width and half height of the artist or None if the artist is not an image
+  """
+  if not isinstance(artist, AxesImage):
+    return None
+  extent = artist.get_extent()
+  return ((extent[1] - extent[0]) / 2, (extent[3] - extent[2]) / 2)
+
+
+def set_artist_position(artist: plt.Artist, position: Tuple[float, float], half_size: Tuple[float, float] = None) -> None:
   """
   set a matplotlib artist's position. Currently supported artist types: Circle, Rectangle, AxesImage.
 
   Args:
       artist (plt.Artist): the artist to move
-      position (np.ndarray): the new position of the artist's center
+      position (Tuple[float, float]): the new position of the artist's center
+      half_size (Tuple[float, float], optional): half width and height of an image artist (see `get_artist_half_size()`). Defaults to None (read from the artist's extent).
   """
   # if artist is a circle, move its center
   if isinstance(artist, Circle):
@@ -285,9 +541,9 @@ def set_artist_position(artist: plt.Artist, position: np.ndarray) -> None:
         position[1] - artist.get_height()/2))
   # if artist is an image, move its center
   elif isinstance(artist, AxesImage):
-    old_extent = artist.get_extent()
-    half_width: float = (old_extent[1] - old_extent[0]) / 2
-    half_height: float = (old_extent[3] - old_extent[2]) / 2
+    if half_size is None:
+      half_size = get_artist_half_size(artist)
+    half_width, half_height = half_size
     image_extent = (
       position[0] - half_width,
       position[0] + half_width,
@@ -295,9 +551,14 @@ def set_artist_position(artist: plt.Artist, position: np.ndarray) -> None:
       position[1] + half_height
     )
     artist.set_extent(image_extent)
+    artist._cached_center = None
 
 
-def set_artist_rotation(artist: plt.Artist, new_rotation_deg: float, trans_data: transforms.Affine2D) -> None:
+def set_artist_rotation(
+    artist: plt.Artist,
+    new_rotation_deg: float,
+    trans_data: transforms.Affine2D,
+    rotation_transform: transforms.Affine2D = None) -> transforms.Affine2D:
   """
   set a matplotlib artist's rotation. Currently tested artist types: Circle, Rectangle, AxesImage.
 
@@ -305,10 +566,18 @@ def set_artist_rotation(artist: plt.Artist, new_rotation_deg: float, trans_data:
       artist (plt.Artist): the artist to rotate
       new_rotation_deg (float): the new rotation of the artist in degrees
       trans_data (transforms.Affine2D): the data transform of the artist (=ax.transData if the artist is in the axes `ax`)
+      rotation_transform (transforms.Affine2D, optional): rotation transform returned by a previous call for the same artist. It is updated in place instead of creating and setting a new transform. Defaults to None.
+
+  Returns:
+      transforms.Affine2D: the rotation transform of the artist
   """
   # rotate artist
   artist_center = get_artist_center(artist)
   # artist_center += self.click_offset
-  artist.set_transform(
-    transforms.Affine2D().rotate_deg_around(artist_center[0], artist_center[1], new_rotation_deg) + trans_data
-  )
\ No newline at end of file
+  if rotation_transform is None:
+    rotation_transform = transforms.Affine2D()
+    artist.set_transform(rotation_transform + trans_data)
+  else:
+    rotation_transform.clear()
+  rotation_transform.rotate_deg_around(artist_center[0], artist_center[1], new_rotation_deg)
+  return rotation_transform
\ No newline at end of file
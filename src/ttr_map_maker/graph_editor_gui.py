@@ -1847,6 +1847,10 @@ def relink_delete_edge(particle_edge: Particle_Edge) -> None:
     if particle == particle_edge:
       particle_2.connected_particles[i] = particle_1
       break
+  # the connected particles were changed in place, so cached terminal nodes have to be recomputed
+  for particle in (particle_1, particle_2):
+    if isinstance(particle, Particle_Edge):
+      particle.invalidate_topology()
 
 # helper function for automatic edge repositioning
 def get_circle_intersection(center_a: np.ndarray, radius_a: np.ndarray, center_b: np.ndarray, radius_b: np.ndarray, epsilon: float = 1e-7) -> np.ndarray:
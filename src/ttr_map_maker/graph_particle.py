@@ -2,10 +2,13 @@
 base class for particles in a particle graph
 """
 from typing import Tuple, List, Union
+import functools
 import json
+import os
 
 import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.image as mpimg
 import matplotlib.patheffects as path_effects
 from matplotlib.patches import Rectangle
 from shapely.geometry import Polygon
@@ -371,7 +374,7 @@ class Graph_Particle:
     recalculate bounding box of particle from `self.position`, `self.rotation`, and `self.bounding_box_size`
 
     returns:
-      (np.ndarray): bounding box as numpy array containing it's corners, in counter-clockwise order
+      (np.ndarray): bounding box as contiguous float64 array of shape (4, 2) containing it's corners, in counter-clockwise order
       (shapely.geometry.Polygon): bounding box as shapely polygon
     """
     width, height = self.bounding_box_size
@@ -380,7 +383,7 @@ class Graph_Particle:
       [width / 2, -height / 2],
       [-width / 2, -height / 2],
       [-width / 2, height / 2]
-    ], dtype=np.float16)
+    ], dtype=np.float64)
 
     # rotate bounding box
     rotation_matrix = get_2d_rotation_matrix(-self.rotation)
@@ -557,6 +560,36 @@ class Graph_Particle:
     return self.id
       
 
+def load_image(filepath: str) -> np.ndarray:
+    """
+    Load an image from the given filepath. Decoded images are cached, so redrawing particles does not read and decode the same file again.
+    The file's modification time is part of the cache key, so an image that was edited or replaced on disk is read again.
+    The returned array is shared between all callers and therefore read-only.
+
+    args:
+      filepath (str): path to the image file
+
+    returns:
+      (np.ndarray): the image as returned by `matplotlib.image.imread()`
+    """
+    return _load_image_cached(filepath, os.path.getmtime(filepath))
+
+@functools.lru_cache(maxsize=256)
+def _load_image_cached(filepath: str, modification_time: float) -> np.ndarray:
+    """
+    Load and cache an image (see `load_image()`).
+
+    args:
+      filepath (str): path to the image file
+      modification_time (float): modification time of the file, only used as part of the cache key
+
+    returns:
+      (np.ndarray): the read-only image as returned by `matplotlib.image.imread()`
+    """
+    image = mpimg.imread(filepath)
+    image.setflags(write=False)
+    return image
+
 def get_box_overlap(box1_poly: Polygon, box2_poly: Polygon) -> Tuple[np.ndarray, float]:
     """
     get overlap between two bounding boxes
@@ -4,15 +4,15 @@ There is an attraction force between the node and target position as well as bet
 
 A node can be connected to other nodes by edges.
 """
-from typing import List, Tuple
+from typing import List, Tuple, Union
+import math
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 import matplotlib.transforms as transforms
 from matplotlib.patches import Rectangle
 
-from graph_particle import Graph_Particle
+from graph_particle import Graph_Particle, load_image
 from particle_node import Particle_Node
 
 
@@ -82,6 +82,93 @@ class Particle_Edge(Graph_Particle):
     self.connection_index = connection_index
     self.image_file_path = None
     self.image_override_filepath = image_override_filepath
+    self._short_edge_indices: Tuple[int, int] = self.get_short_edge_indices()
+    # attraction forces to other edges precomputed for the current simulation step (see `compute_edge_attraction_forces()`)
+    self.edge_attraction_cache: dict["Particle_Edge", Tuple[np.ndarray, np.ndarray]] = {}
+    # the two nodes at the ends of the connection this edge belongs to (see `get_terminal_nodes()`)
+    self._terminal_nodes: Tuple[Particle_Node, Particle_Node] = None
+    # last result of `get_image_rotation()` and the inputs it was calculated from
+    self._image_rotation_cache: Tuple[tuple, float] = (None, None)
+
+  def get_short_edge_indices(self) -> Tuple[int, int]:
+    """
+    get the indices of the first corners of the two short edges of the bounding box. Edge `i` goes from corner `i` to corner `(i+1) % 4` (see `Graph_Particle.update_bounding_box()`). Edges 0 and 2 have length `height`, edges 1 and 3 have length `width`.
+
+    Returns:
+        Tuple[int, int]: indices of the short edges of the bounding box
+    """
+    width, height = self.bounding_box_size
+    if height <= width:
+      return (0, 2)
+    return (1, 3)
+
+  def set_size(self, size: Union[float, Tuple[float, float]]):
+    """
+    Set the size of the edge and update which edges of the bounding box are the short ones.
+
+    Args:
+        size (Union[float, Tuple[float, float]]): new size of the edge. If a float is given, the edge will be a square with side length `size`.
+    """
+    super().set_size(size)
+    self._short_edge_indices = self.get_short_edge_indices()
+
+  def set_connected_particles(self, particles: list[Graph_Particle]):
+    """
+    Set the particles that this edge is connected to and invalidate the cached terminal nodes.
+
+    Args:
+        particles (list[Graph_Particle]): list of particles that this edge is connected to
+    """
+    super().set_connected_particles(particles)
+    self.invalidate_topology()
+
+  def add_connected_particle(self, particle: Graph_Particle):
+    """
+    Add a particle that this edge is connected to and invalidate the cached terminal nodes.
+
+    Args:
+        particle (Graph_Particle): particle that this edge is connected to
+    """
+    super().add_connected_particle(particle)
+    self.invalidate_topology()
+
+  def invalidate_topology(self):
+    """
+    Clear the cached terminal nodes. This must be called whenever `self.connected_particles` is changed without using `set_connected_particles()` or `add_connected_particle()`.
+    """
+    self._terminal_nodes = None
+
+  def get_terminal_nodes(self) -> Tuple[Particle_Node, Particle_Node]:
+    """
+    Find the two nodes at the ends of the connection this edge belongs to by following `connected_particles` in both directions. The result is cached until `invalidate_topology()` is called.
+
+    Raises:
+        ValueError: If the graph is not connected properly, one of the nodes cannot be found.
+
+    Returns:
+        Tuple[Particle_Node, Particle_Node]: the two nodes this edge is (directly or indirectly) connected to
+    """
+    if self._terminal_nodes is not None:
+      return self._terminal_nodes
+    visited_particle_ids = {self.get_id()}
+    connected_nodes = [self, self]
+    for i in range(2):
+      while True: # find a connected node
+        connected_index = 0
+        new_node = connected_nodes[i].connected_particles[connected_index]
+        while True: # find a connected node that has not been visited yet
+          if not new_node.get_id() in visited_particle_ids:
+            break
+          connected_index += 1
+          if connected_index >= len(connected_nodes[i].connected_particles):
+            raise ValueError("Could not find a connected particle that has not been visited yet. Ensure that the graph is connected properly.")
+          new_node = connected_nodes[i].connected_particles[connected_index]
+        connected_nodes[i] = new_node
+        visited_particle_ids.add(connected_nodes[i].get_id())
+        if isinstance(connected_nodes[i], Particle_Node):
+          break
+    self._terminal_nodes = (connected_nodes[0], connected_nodes[1])
+    return self._terminal_nodes
 
 
   def get_adjustable_settings(self) -> dict[str, object]:
@@ -213,20 +300,61 @@ class Particle_Edge(Graph_Particle):
         np.ndarray: attraction force vector
         np.ndarray: closest point on this edge to the other edge
     """
-    min_distance = np.inf
-    closest_points = np.zeros((2, 2))
-    for point_1 in self.get_edge_midpoints():
-      for point_2 in other_edge.get_edge_midpoints():
-        distance = np.linalg.norm(point_1 - point_2)
-        if distance < min_distance:
-          min_distance = distance
-          closest_points[0, :] = point_1
-          closest_points[1, :] = point_2
-    
+    cached_force = self.edge_attraction_cache.get(other_edge)
+    if cached_force is not None:
+      return cached_force
+    midpoints_1 = self.get_edge_midpoints()
+    midpoints_2 = other_edge.get_edge_midpoints()
+    # squared distances between all pairs of midpoints
+    difference = midpoints_1[:, None, :] - midpoints_2[None, :, :]
+    squared_distances = np.einsum("ijk,ijk->ij", difference, difference)
+    i, j = divmod(int(squared_distances.argmin()), 2)
+    min_distance = math.sqrt(squared_distances[i, j])
+    closest_points = np.array([midpoints_1[i], midpoints_2[j]])
+
     force_direction = (closest_points[1, :] - closest_points[0, :]) / min_distance
     translation_force = self.edge_attraction * self.attraction_from_distance(min_distance) * force_direction
     return translation_force, closest_points[0, :]
 
+  @classmethod
+  def compute_edge_attraction_forces(cls,
+      edge_pairs: List[Tuple["Particle_Edge", "Particle_Edge"]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the attraction forces for many pairs of edges at once. This gives the same results as calling `edge_1.get_edge_attraction_force(edge_2)` for every pair `(edge_1, edge_2)`, but the midpoints of each edge are only calculated once and all distances are calculated in a single numpy pass.
+
+    Args:
+        edge_pairs (List[Tuple[Particle_Edge, Particle_Edge]]): pairs of edges. Forces are calculated for the first edge of each pair.
+
+    Returns:
+        np.ndarray: (P, 2) array of attraction force vectors
+        np.ndarray: (P, 2) array of closest points on the first edge of each pair to the second one
+    """
+    n_pairs: int = len(edge_pairs)
+    if n_pairs == 0:
+      return np.zeros((0, 2)), np.zeros((0, 2))
+    # calculate midpoints of every edge only once
+    edge_indices: dict["Particle_Edge", int] = {}
+    for pair in edge_pairs:
+      for edge in pair:
+        edge_indices.setdefault(edge, len(edge_indices))
+    midpoints = np.array([edge.get_edge_midpoints() for edge in edge_indices]) # (N, 2, 2)
+    midpoints_1 = midpoints[[edge_indices[edge_1] for edge_1, _ in edge_pairs]] # (P, 2, 2)
+    midpoints_2 = midpoints[[edge_indices[edge_2] for _, edge_2 in edge_pairs]] # (P, 2, 2)
+    # squared distances between all pairs of midpoints for all pairs of edges
+    difference = midpoints_1[:, :, None, :] - midpoints_2[:, None, :, :] # (P, 2, 2, 2)
+    squared_distances = np.einsum("pijk,pijk->pij", difference, difference).reshape(n_pairs, 4)
+    closest_indices = squared_distances.argmin(axis=1)
+    pair_indices = np.arange(n_pairs)
+    min_distances = np.sqrt(squared_distances[pair_indices, closest_indices])
+    closest_points_1 = midpoints_1[pair_indices, closest_indices // 2]
+    closest_points_2 = midpoints_2[pair_indices, closest_indices % 2]
+
+    with np.errstate(invalid="ignore", divide="ignore"): # coinciding midpoints give nan, like the single pair version
+      force_directions = (closest_points_2 - closest_points_1) / min_distances[:, None]
+    edge_attractions = np.array([edge_1.edge_attraction for edge_1, _ in edge_pairs])
+    translation_forces = (edge_attractions * edge_pairs[0][0].attraction_from_distance(min_distances))[:, None] * force_directions
+    return translation_forces, closest_points_1
+
   def get_node_attraction_force(self, node: Graph_Particle) -> Tuple[np.ndarray, np.ndarray]:
     """
     get attraction force between this particle and the node depending on the minimum distance between the node and the edge's bounding box's shortest edges.
@@ -239,39 +367,32 @@ class Particle_Edge(Graph_Particle):
         np.ndarray: attraction force vector
         np.ndarray: closest midpoint to the node (midpoints are on a short side of this edge particle)
     """
-    min_distance = np.inf
-    closest_point = np.zeros(2)
-    for point in self.get_edge_midpoints():
-      distance = np.linalg.norm(point - node.position)
-      if distance < min_distance:
-        min_distance = distance
-        closest_point = point
-
-    force_direction = (node.position - closest_point) / min_distance
+    midpoints = self.get_edge_midpoints()
+    difference = node.position - midpoints
+    squared_distances = np.einsum("ij,ij->i", difference, difference)
+    closest_index = int(squared_distances.argmin())
+    min_distance = math.sqrt(squared_distances[closest_index])
+    closest_point = midpoints[closest_index]
+
+    force_direction = difference[closest_index] / min_distance
     translation_force = self.node_attraction * self.attraction_from_distance(min_distance) * force_direction
 
     force_anchor = closest_point
 
     return translation_force, force_anchor
 
-  def get_edge_midpoints(self, eps=1e-8):
+  def get_edge_midpoints(self):
     """
-    get the midpoints of the edges of the bounding box of this edge
+    get the midpoints of the short edges of the bounding box of this edge
 
     Returns:
         np.ndarray: midpoints of the edges of the bounding box of this edge
     """
-    midpoints = np.zeros((2, 2))
-    found_n_shortest_edges = 0
-    for i in range(4):
-      corner_1 = self.bounding_box[i]
-      corner_2 = self.bounding_box[(i + 1) % 4]
-      if np.linalg.norm(corner_1 - corner_2) - np.min(self.bounding_box_size) < eps:
-        # check if corner_1 - corner_2 are a short edge of the bounding box.
-        midpoints[found_n_shortest_edges, :] = (corner_1 + corner_2) / 2
-        found_n_shortest_edges += 1
-        if found_n_shortest_edges == 2:
-          break
+    bounding_box = self.bounding_box
+    i, j = self._short_edge_indices
+    midpoints = np.empty((2, 2))
+    midpoints[0] = (bounding_box[i] + bounding_box[(i + 1) % 4]) * 0.5
+    midpoints[1] = (bounding_box[j] + bounding_box[(j + 1) % 4]) * 0.5
     return midpoints
 
   def attraction_from_distance(self, distance):
@@ -351,9 +472,9 @@ class Particle_Edge(Graph_Particle):
       super().draw_bounding_box(ax, color, border_color, alpha, zorder, movable)
     else:
       if self.image_override_filepath: # use override image
-        mpl_image = mpimg.imread(self.image_override_filepath)
+        mpl_image = load_image(self.image_override_filepath)
       else: # use image at `self.image_file_path`
-        mpl_image = mpimg.imread(self.image_file_path)
+        mpl_image = load_image(self.image_file_path)
       edge_extent = (
         self.position[0] - self.bounding_box_size[0] / 2,
         self.position[0] + self.bounding_box_size[0] / 2,
@@ -385,41 +506,46 @@ class Particle_Edge(Graph_Particle):
     Returns:
         float: rotation in radians
     """
-    # find noes this edge is connected to
-    visited_particle_ids = {self.get_id()}
-    connected_nodes = [self, self]
-    for i in range(2):
-      while True: # find a connected node
-        connected_index = 0
-        new_node = connected_nodes[i].connected_particles[connected_index]
-        while True: # find a connected node that has not been visited yet
-          if not new_node.get_id() in visited_particle_ids:
-            break
-          connected_index += 1
-          if connected_index >= len(connected_nodes[i].connected_particles):
-            raise ValueError("Could not find a connected particle that has not been visited yet. Ensure that the graph is connected properly.")
-          new_node = connected_nodes[i].connected_particles[connected_index]
-        connected_nodes[i] = new_node
-        visited_particle_ids.add(connected_nodes[i].get_id())
-        if isinstance(connected_nodes[i], Particle_Node):
-          break
+    # find nodes this edge is connected to
+    node_1, node_2 = self.get_terminal_nodes()
+    node_1_position = node_1.position
+    node_2_position = node_2.position
+    # reuse the last result if neither the rotation nor the nodes changed since then
+    cache_key = (self.rotation, id(node_1), node_1_position.tobytes(), id(node_2), node_2_position.tobytes())
+    cached_key, cached_rotation = self._image_rotation_cache
+    if cache_key == cached_key:
+      return cached_rotation
+    image_rotation = self._calculate_image_rotation(node_1_position, node_2_position)
+    self._image_rotation_cache = (cache_key, image_rotation)
+    return image_rotation
+
+  def _calculate_image_rotation(self, node_1_position: np.ndarray, node_2_position: np.ndarray) -> float:
+    """
+    calculate image rotation based on `self.rotation` and the positions of the two nodes this edge connects.
+
+    Args:
+        node_1_position (np.ndarray): position of the first node
+        node_2_position (np.ndarray): position of the second node
+
+    Returns:
+        float: rotation in radians
+    """
     # calculate normal vector of direct connection between nodes
-    node_1_position = connected_nodes[0].position
-    node_2_position = connected_nodes[1].position
     node_1_to_node_2 = node_2_position - node_1_position
-    norm = np.linalg.norm(node_1_to_node_2)
+    norm = math.hypot(node_1_to_node_2[0], node_1_to_node_2[1])
     if norm == 0:
       print(f"WARNING: edge {self.location_1_name}-{self.location_2_name} has length zero. Using original rotation of edge particle.")
       return self.rotation
-    node_1_to_node_2 = node_1_to_node_2 / norm
-    normal_vector = np.array([-node_1_to_node_2[1], node_1_to_node_2[0]], dtype=np.float16) # rotate by 90°
+    # normal vector of the connection (rotated by 90°)
+    normal_x = -node_1_to_node_2[1] / norm
+    normal_y = node_1_to_node_2[0] / norm
     # ensure that normal vector direction is always pointing upwards
-    if normal_vector[1] < 0:
-      normal_vector = -normal_vector
+    if normal_y < 0:
+      normal_x, normal_y = -normal_x, -normal_y
     # if normal vector is to the right of the current rotation vector, rotate by 180°
     # this aligns the image with the normal vector
-    if np.cross(normal_vector, np.array([np.cos(self.rotation), np.sin(self.rotation)], dtype=np.float16)) > 0:
-      return self.rotation + np.pi
+    if normal_x * math.sin(self.rotation) - normal_y * math.cos(self.rotation) > 0:
+      return self.rotation + math.pi
     return self.rotation
 
 
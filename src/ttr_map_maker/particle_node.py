@@ -8,11 +8,10 @@ from typing import Union, Tuple
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 import matplotlib.transforms as transforms
 from matplotlib.patches import Circle
 
-from graph_particle import Graph_Particle
+from graph_particle import Graph_Particle, load_image
 
 
 class Particle_Node(Graph_Particle):
@@ -175,7 +174,7 @@ class Particle_Node(Graph_Particle):
     else:
       if override_image_path is None: # draw image saved in self.image_file_path
         override_image_path = self.image_file_path
-      mpl_image = mpimg.imread(override_image_path)
+      mpl_image = load_image(override_image_path)
       img_extent = self.get_extent(scale, override_position)
       plotted_image = ax.imshow(mpl_image, extent=img_extent, zorder=zorder, picker=True)
       # rotate image using transformation
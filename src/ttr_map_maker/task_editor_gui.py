@@ -3,15 +3,19 @@ This module implements task edit functionality for the TTR board layout GUI.
 
 This is done via a class Task_Editor_GUI which can be seen as an extension of `Board_Layout_GUI`, which is the intended way to use it.
 """
+import concurrent.futures
+import functools
 import tkinter as tk
-from typing import Tuple, List, Callable
+import tkinter.font as tkfont
+from typing import Tuple, List, Callable, Union
 
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backend_bases import PickEvent, MouseEvent
 import networkx as nx
 
-from auto_scroll_frame import Auto_Scroll_Frame
+from virtual_list_frame import Virtual_List_Frame
 from ttr_particle_graph import TTR_Particle_Graph
 from ttr_task import TTR_Task
 from particle_node import Particle_Node
@@ -20,6 +24,10 @@ from graph_analysis import create_nx_graph
 
 
 class Task_Editor_GUI:
+  # texts of the buttons shown in every row of the task list
+  _EDIT_TEXT: str = "Edit"
+  _DELETE_TEXT: str = "Delete"
+
   def __init__(self,
       master: tk.Tk,
       color_config: dict[str, str],
@@ -65,6 +73,13 @@ class Task_Editor_GUI:
     # save grid padding for later use
     self.grid_pad_x: int = grid_padding[0]
     self.grid_pad_y: int = grid_padding[1]
+    # padding shared by the widgets of every task location row
+    self.grid_pad_left: Tuple[int, int] = (self.grid_pad_x, 0)
+    self.grid_pad_bottom: Tuple[int, int] = (0, self.grid_pad_y)
+    # colors of all delete buttons, shared by every row of the task list and the location list
+    self.delete_button_kwargs: dict[str, str] = dict(
+        bg=color_config["delete_button_bg_color"],
+        fg=color_config["delete_button_fg_color"])
 
     # extract tkinter style methods
     self.add_frame_style: Callable = tk_config_methods["add_frame_style"]
@@ -78,6 +93,11 @@ class Task_Editor_GUI:
     # set up task edit variables
     self.node_names: List[str] = ["None"] + sorted(self.particle_graph.get_locations())
     self.highlighted_particles: List[Particle_Node] = []
+    # task lengths are calculated in a worker thread, so the GUI keeps responding. The thread is only started when it is needed.
+    self.task_length_executor: concurrent.futures.ThreadPoolExecutor = None
+    self.task_length_future: concurrent.futures.Future = None
+    self.task_length_poll_id: str = None # id of the scheduled `check_task_lengths_ready` call
+    self._redraw_scheduled: bool = False
 
     self.init_task_edit_gui()
 
@@ -87,7 +107,9 @@ class Task_Editor_GUI:
     This method initializes the task edit GUI with all its widgets.
     """
     # set up task edit variables
-    self.task_visibility_vars: dict[str, tk.BooleanVar] = {}
+    self.task_list: List[TTR_Task] = []
+    self.task_visibility: np.ndarray = np.zeros(0, dtype=bool) # visibility of each task in `self.task_list`
+    self.task_content_frame: tk.Frame = None # parent of all task editor widgets
 
     # set up task edit frame
     self.open_task_overview()
@@ -95,10 +117,22 @@ class Task_Editor_GUI:
 
   def clear_task_edit_frame(self):
     """
-    Clears the task edit frame.
+    Clears the task edit frame. All widgets of the task editor are children of `self.task_content_frame`, so they are destroyed with a single call and a new, empty content frame is created.
     """
-    for widget in self.task_edit_frame.winfo_children():
-      widget.destroy()
+    if self.task_content_frame is not None:
+      self.task_content_frame.destroy()
+    self.task_content_frame = tk.Frame(self.task_edit_frame)
+    self.add_frame_style(self.task_content_frame)
+    self.task_content_frame.grid(
+        row=0,
+        column=0,
+        sticky="nsew",
+        padx=0,
+        pady=0)
+    self.task_content_frame.grid_columnconfigure(0, weight=1)
+    # the task list was destroyed with the content frame
+    self.task_list_view: Virtual_List_Frame = None
+    self.empty_task_list_label: tk.Label = None
 
   def unbind_all_mouse_events(self):
     """
@@ -107,13 +141,13 @@ class Task_Editor_GUI:
     # unbind mouse events
     self.unbind_task_overview_mouse_events()
     self.unbind_task_edit_mouse_events()
+    # discard task lengths that are still being calculated and stop the worker thread, the task list is about to be destroyed
+    self.stop_task_length_calculation()
     # hide all highlighted tasks
-    for task_name, task_var in self.task_visibility_vars.items():
-      if task_name != "all" and task_var.get():
-        self.particle_graph.tasks[task_name].erase()
-        task_var.set(False)
-    for widget in self.task_edit_frame.winfo_children():
-      widget.destroy()
+    self.hide_all_tasks()
+    if self.task_content_frame is not None:
+      self.task_content_frame.destroy()
+      self.task_content_frame = None
     self.canvas.draw_idle()
 
 
@@ -128,93 +162,113 @@ class Task_Editor_GUI:
     """
     # clear task edit frame
     self.clear_task_edit_frame()
+    # the overview is kept in its own frame, so it can be hidden while a task is edited
+    self.task_overview_frame: tk.Frame = tk.Frame(self.task_content_frame)
+    self.add_frame_style(self.task_overview_frame)
+    self.task_overview_frame.grid(
+        row=0,
+        column=0,
+        sticky="nsew",
+        padx=0,
+        pady=0)
+    self.task_details_frame: tk.Frame = None
 
-    row_index: int = 0
+    # the header widgets are stacked linearly, so they are packed into their own frame
+    header_frame: tk.Frame = tk.Frame(self.task_overview_frame)
+    self.add_frame_style(header_frame)
+    header_frame.pack(side=tk.TOP, fill=tk.X)
     # create task edit headline
-    headline_label = tk.Label(self.task_edit_frame, text="Task Overview")
+    headline_label = tk.Label(header_frame, text="Task Overview")
     self.add_label_style(headline_label, font_type="bold")
-    headline_label.grid(
-        row=row_index,
-        column=0,
-        columnspan=2,
-        sticky="nw",
+    headline_label.pack(
+        side=tk.TOP,
+        anchor="nw",
         padx=self.grid_pad_x,
         pady=self.grid_pad_y)
-    row_index += 1
     # add button to calculate all task lengths
     calc_task_lengths_button = tk.Button(
-        self.task_edit_frame,
+        header_frame,
         text="Calculate Task Lengths",
         command=self.calculate_all_task_lengths)
     self.add_button_style(calc_task_lengths_button)
-    calc_task_lengths_button.grid(
-        row=row_index,
-        column=0,
-        columnspan=2,
-        sticky="new",
+    calc_task_lengths_button.pack(
+        side=tk.TOP,
+        fill=tk.X,
         padx=self.grid_pad_x,
         pady=self.grid_pad_y)
-    row_index += 1
     # add a button to calculate all task names (unless they have been named manually)
     calc_task_names_button = tk.Button(
-        self.task_edit_frame,
+        header_frame,
         text="Calculate Task Names",
         command=self.calculate_all_task_names)
     self.add_button_style(calc_task_names_button)
-    calc_task_names_button.grid(
-        row=row_index,
-        column=0,
-        columnspan=2,
-        sticky="new",
+    calc_task_names_button.pack(
+        side=tk.TOP,
+        fill=tk.X,
         padx=self.grid_pad_x,
         pady=self.grid_pad_y)
-    row_index += 1
-    # add checkbutton to toggle visibility of all tasks
-    all_task_visibility_var: tk.BooleanVar = tk.BooleanVar()
-    self.task_visibility_vars["all"] = all_task_visibility_var
+    # add checkbutton to toggle visibility of all tasks and button to add a new task in one line
+    task_actions_frame: tk.Frame = tk.Frame(header_frame)
+    self.add_frame_style(task_actions_frame)
+    task_actions_frame.pack(side=tk.TOP, fill=tk.X)
+    self.all_tasks_visibility_var: tk.BooleanVar = tk.BooleanVar()
     toggle_task_visibility_button = tk.Checkbutton(
-        self.task_edit_frame,
+        task_actions_frame,
         text="Show/hide all",
-        variable=all_task_visibility_var,
+        variable=self.all_tasks_visibility_var,
         command=self.toggle_all_tasks_visibility)
     self.add_checkbutton_style(toggle_task_visibility_button)
-    toggle_task_visibility_button.grid(
-        row=row_index,
-        column=0,
-        sticky="w",
+    toggle_task_visibility_button.pack(
+        side=tk.LEFT,
         padx=self.grid_pad_x,
         pady=self.grid_pad_y)
     # add button to add new task
     add_task_button = tk.Button(
-        self.task_edit_frame,
+        task_actions_frame,
         text="Add Task",
         command=self.add_task)
     self.add_button_style(add_task_button)
-    add_task_button.grid(
-        row=row_index,
-        column=1,
-        sticky="e",
+    add_task_button.pack(
+        side=tk.RIGHT,
         padx=self.grid_pad_x,
         pady=self.grid_pad_y)
-    row_index += 1
-    
+
     # add task list
-    task_list_outer_frame = tk.Frame(
-        self.task_edit_frame,
+    self.task_list_outer_frame: tk.Frame = tk.Frame(
+        self.task_overview_frame,
         background=self.color_config["frame_bg_color"],
-        height=250,
         width=self.task_edit_frame.winfo_width())
-    task_list_outer_frame.grid(
-        row=row_index,
-        column=0,
-        columnspan=2,
-        sticky="nsew",
-        padx=0,#self.grid_pad_x,
-        pady=0)
-    task_list_outer_frame.grid_rowconfigure(0, weight=1)
-    task_list_auto_frame = Auto_Scroll_Frame(
-        task_list_outer_frame,
-        canvas_kwargs=dict(background=self.color_config["bg_color"]),
+    self.task_list_outer_frame.grid_rowconfigure(0, weight=1)
+    self.task_list_outer_frame.grid_columnconfigure(0, weight=1)
+    self.rebuild_task_model()
+    # the scrollable task list is only created once there are tasks to show
+    if self.task_list:
+      self.create_task_list_view()
+    else:
+      self.show_empty_task_list()
+    # attach the task list only after all rows were built, so the layout is only calculated once
+    self.task_list_outer_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+    self.bind_task_overview_mouse_events()
+
+  def create_task_list_view(self):
+    """
+    Create the scrollable list of all tasks in `self.task_list_outer_frame`, replacing the placeholder shown for an empty task list. Only the visible tasks are drawn. Their canvas items are reused while scrolling (see `Virtual_List_Frame`).
+    """
+    if self.empty_task_list_label is not None:
+      self.empty_task_list_label.destroy()
+      self.empty_task_list_label = None
+    self.init_task_row_layout()
+    self.task_list_widgets: List[Tuple[int, tk.Checkbutton, int, int, tk.Button, tk.Button]] = []
+    self.task_row_indices: List[int] = [] # index of the task shown in each reusable row
+    self.task_row_visibility_vars: List[tk.BooleanVar] = [] # visibility of the task shown in each reusable row
+    self.task_list_view = Virtual_List_Frame(
+        self.task_list_outer_frame,
+        create_row=self._create_task_row,
+        bind_row=self._bind_task_row,
+        resize_rows=self._resize_task_rows,
+        row_count=len(self.task_list),
+        max_visible_rows=5,
+        canvas_kwargs=dict(background=self.color_config["frame_bg_color"]),
         frame_kwargs=dict(background=self.color_config["bg_color"]),
         scrollbar_kwargs=dict(
             troughcolor=self.color_config["bg_color"],
@@ -227,130 +281,253 @@ class Task_Editor_GUI:
             highlightcolor=self.color_config["bg_color"],
             )
         )
-    task_list_auto_frame.scrollframe.grid_columnconfigure(0, weight=1)
-    task_list_frame: tk.Frame = task_list_auto_frame.scrollframe
-    row_index += 1
-    # add tasks to subframe
-    task_row_index: int = 0
-    self.task_list_widgets: List[Tuple[tk.Frame, tk.Label, tk.Checkbutton, tk.Label, tk.Button, tk.Button]] = []
-    self.task_list: List[TTR_Task] = []
-    for ttr_task in self.particle_graph.tasks.values():
-      task_widgets = self._show_single_task_summary(ttr_task, task_list_frame, task_row_index)
-      self.task_list_widgets.append(task_widgets)
-      self.task_list.append(ttr_task)
-      task_row_index += 1
-    task_list_auto_frame._on_configure()
-    self.bind_task_overview_mouse_events()
+    self.task_list_canvas: tk.Canvas = self.task_list_view.canvas
+    self.task_list_view.refresh()
+    self.task_list_view.grid(
+        row=0,
+        column=0,
+        sticky="nsew",
+        padx=0,
+        pady=0)
+
+  def show_empty_task_list(self):
+    """
+    Show a placeholder instead of the task list if there are no tasks. This avoids creating the canvas and scrollbar of the task list until the first task is added.
+    """
+    if self.task_list_view is not None:
+      self.task_list_view.destroy()
+      self.task_list_view = None
+    if self.empty_task_list_label is not None:
+      return
+    self.empty_task_list_label = tk.Label(self.task_list_outer_frame, text="No tasks yet")
+    self.add_label_style(self.empty_task_list_label)
+    self.empty_task_list_label.grid(
+        row=0,
+        column=0,
+        sticky="w",
+        padx=self.grid_pad_x,
+        pady=self.grid_pad_y)
 
-  def _show_single_task_summary(self,
-      ttr_task: TTR_Task,
-      task_list_frame: tk.Frame,
-      task_row_index: int) -> Tuple[tk.Frame, tk.Label, tk.Checkbutton, tk.Label, tk.Button, tk.Button]:
+  def rebuild_task_model(self):
     """
-    Adds the widgets for a single task to the task list frame.
+    Collect all tasks of the particle graph in `self.task_list` and reset their visibility. Rows of the task list only read the display names and points texts cached by the tasks (see `TTR_Task.display_name` and `TTR_Task.get_points_text()`).
+    Tasks are added, renamed and deleted in `particle_graph.tasks`, followed by `sync_task_model()`.
+    """
+    self.task_list: List[TTR_Task] = list(self.particle_graph.tasks.values())
+    self.task_visibility: np.ndarray = np.zeros(len(self.task_list), dtype=bool)
+
+  def update_task_model(self, task_index: int):
+    """
+    Update the row of the task with the given index if it is visible, e.g. after the task was renamed.
 
     Args:
-        ttr_task (TTR_Task): The task to add the widgets for.
-        task_list_frame (tk.Frame): The frame to add the widgets to.
-        task_row_index (int): The row index to add the widgets to.
+        task_index (int): The index of the task in `self.task_list`.
+    """
+    self.task_list_view.refresh_row(task_index)
 
-    Returns:
-        tk.Frame: The frame containing the widgets for the task.
+  def sync_task_model(self):
+    """
+    Update the task list after tasks were added to, removed from or renamed in `particle_graph.tasks`. Tasks keep their visibility, tasks that were removed from the particle graph are erased from the canvas.
     """
-    task_name = ttr_task.name
-    if not ttr_task.name in self.task_visibility_vars:
-      task_var: tk.BooleanVar = tk.BooleanVar(value=False)
-      self.task_visibility_vars[task_name]: tk.BooleanVar = task_var
+    visible_tasks: List[TTR_Task] = [self.task_list[task_index] for task_index in np.flatnonzero(self.task_visibility)]
+    self.task_list = list(self.particle_graph.tasks.values())
+    task_ids: set[int] = {id(task) for task in self.task_list}
+    visible_task_ids: set[int] = set()
+    for task in visible_tasks:
+      if id(task) in task_ids:
+        visible_task_ids.add(id(task))
+      else: # task was removed
+        task.erase()
+        self.schedule_redraw()
+    self.task_visibility = np.array([id(task) in visible_task_ids for task in self.task_list], dtype=bool)
+    self.update_all_tasks_visibility_var()
+    # rebind the visible rows, this updates the numbers and names of all tasks
+    if not self.task_list:
+      self.show_empty_task_list()
+    elif self.task_list_view is None:
+      self.create_task_list_view()
     else:
-      task_var = self.task_visibility_vars[task_name]
-    task_frame = tk.Frame(task_list_frame)
-    self.add_frame_style(task_frame)
-    task_frame.grid(
-        row=task_row_index,
-        column=0,
-        sticky="nsew",
-        padx=0,
-        pady=(self.grid_pad_y, 0))
-    task_frame.grid_columnconfigure(1, weight=1)
+      self.task_list_view.refresh(row_count=len(self.task_list))
+
+  def add_task_to_graph(self, task: TTR_Task):
+    """
+    Add the given task to `particle_graph.tasks` using its name as key. If a different task with the same name exists, it is replaced and a warning is printed. Call `sync_task_model()` afterwards to update the task list.
+
+    Args:
+        task (TTR_Task): The task to add.
+    """
+    existing_task: TTR_Task = self.particle_graph.tasks.get(task.name)
+    if existing_task is not None and existing_task is not task:
+      print(f"Warning: Task '{task.name}' replaces an existing task with the same name.")
+    self.particle_graph.tasks[task.name] = task
+
+  def init_task_row_layout(self):
+    """
+    Precompute the fonts and positions used to draw the rows of the task list. Task numbers and points are drawn as canvas text, so the label style is read from a temporary label.
+    """
+    style_label = tk.Label(self.task_content_frame)
+    self.add_label_style(style_label, font_type="bold")
+    self.task_number_font: str = style_label.cget("font")
+    self.add_label_style(style_label)
+    self.task_points_font: str = style_label.cget("font")
+    self.task_text_color: str = style_label.cget("fg")
+    style_label.destroy()
+    style_button = tk.Button(self.task_content_frame, text=self._DELETE_TEXT)
+    self.add_button_style(style_button)
+    self.task_delete_button_width: int = style_button.winfo_reqwidth()
+    style_button.config(text=self._EDIT_TEXT)
+    task_buttons_width: int = self.task_delete_button_width + style_button.winfo_reqwidth()
+    style_button.destroy()
+    # task numbers are left of the checkbutton showing the task name, points and buttons are right of it
+    points_font = tkfont.Font(font=self.task_points_font)
+    self.task_name_x: int = 2*self.grid_pad_x + tkfont.Font(font=self.task_number_font).measure("000.")
+    self.task_points_height: int = points_font.metrics("linespace")
+    self.task_row_right_width: int = max(task_buttons_width, points_font.measure("points: 00 + 00"))
+    # x position of all right aligned items. This is updated whenever the task list is resized.
+    self.task_row_right_x: int = max(
+        self.task_edit_frame.winfo_width(),
+        self.task_name_x + self.task_row_right_width + 20*points_font.measure("0"))
+
+  def _create_task_row(self,
+      task_list_canvas: tk.Canvas,
+      row_slot: int) -> None:
+    """
+    Draws the items of a single (reusable) row of the task list. Task number and points are drawn as canvas text, only the checkbutton and buttons are embedded widgets. The row is filled with the information of a task by `_bind_task_row`.
+
+    Args:
+        task_list_canvas (tk.Canvas): The canvas to draw the row on.
+        row_slot (int): The index of the row in the list of reusable rows.
+    """
+    grid_pad_x: int = self.grid_pad_x
+    grid_pad_y: int = self.grid_pad_y
+    add_button_style: Callable = self.add_button_style
+    row_tags: Tuple[str] = (Virtual_List_Frame.get_row_tag(row_slot),)
+    right_tags: Tuple[str] = row_tags + ("task_row_right",)
+    right_x: int = self.task_row_right_x - grid_pad_x
     # add task number
-    task_number_label = tk.Label(task_frame, text=f"{task_row_index+1}.")
-    self.add_label_style(task_number_label, font_type="bold")
-    task_number_label.grid(
-        row=0,
-        column=0,
-        rowspan=2,
-        sticky="w",
-        padx=(self.grid_pad_x, 0),
-        pady=0)
-    # task_row_index += 1
-    # add checkbutton to toggle visibility of task
-    if " - " in task_name:
-      task_name = "\n".join(task_name.split(" - "))
+    task_number_text_id: int = task_list_canvas.create_text(
+        grid_pad_x, grid_pad_y,
+        anchor="nw",
+        font=self.task_number_font,
+        fill=self.task_text_color,
+        tags=row_tags)
+    # add checkbutton to toggle visibility of task. Task names have up to two lines, so all rows have the same height.
+    task_visibility_var: tk.BooleanVar = tk.BooleanVar(value=False)
     task_visibility_button = tk.Checkbutton(
-        task_frame,
-        text=task_name,
+        task_list_canvas,
         justify="left",
         anchor="w",
-        variable=task_var,
-        command=lambda task_var=task_var, task=ttr_task: self.toggle_task_visibility(task_var, task))
+        height=2,
+        variable=task_visibility_var,
+        command=functools.partial(self.toggle_task_row_visibility, row_slot))
     self.add_checkbutton_style(task_visibility_button)
-    task_visibility_button.grid(
-        row=0,
-        column=1,
-        rowspan=2,
-        sticky="we",
-        padx=self.grid_pad_x,
-        pady=self.grid_pad_y)
-    # add label to show task points. If task has bonus points, show them as well (handled in get_task_points_label)
-    task_points_label = tk.Label(
-        task_frame,
-        text=self.get_task_points_label(ttr_task))
-    self.add_label_style(task_points_label)
-    task_points_label.grid(
-        row=0,
-        column=2,
-        columnspan=2,
-        sticky="nw",
-        padx=(0, self.grid_pad_x),
-        pady=(self.grid_pad_y,0))
-    # add button to edit task
-    edit_task_button = tk.Button(
-        task_frame,
-        text="Edit",
-        command=lambda task=ttr_task: self.edit_task(task))
-    self.add_button_style(edit_task_button)
-    edit_task_button.grid(
-        row=1,
-        column=2,
-        sticky="ne",
-        padx=0, # (0, self.grid_pad_x),
-        pady=0)
+    task_visibility_window_id: int = task_list_canvas.create_window(
+        self.task_name_x, grid_pad_y,
+        window=task_visibility_button,
+        anchor="nw",
+        width=max(1, right_x - self.task_row_right_width - grid_pad_x - self.task_name_x),
+        tags=row_tags)
+    # add text to show task points. If task has bonus points, show them as well (handled in TTR_Task.get_points_text)
+    task_points_text_id: int = task_list_canvas.create_text(
+        right_x, grid_pad_y,
+        anchor="ne",
+        font=self.task_points_font,
+        fill=self.task_text_color,
+        tags=right_tags)
     # add button to delete task
     delete_task_button = tk.Button(
-        task_frame,
-        text="Delete",
-        command=lambda task=ttr_task, task_index=task_row_index: self.delete_task(task, task_index))
-    self.add_button_style(delete_task_button)
-    delete_task_button.config(
-        bg=self.color_config["delete_button_bg_color"],
-        fg=self.color_config["delete_button_fg_color"])
-    delete_task_button.grid(
-        row=1,
-        column=3,
-        sticky="nw",
-        padx=0,
-        pady=0)
+        task_list_canvas,
+        text=self._DELETE_TEXT,
+        command=functools.partial(self.delete_task_row, row_slot))
+    add_button_style(delete_task_button)
+    delete_task_button.config(**self.delete_button_kwargs)
+    task_list_canvas.create_window(
+        right_x, grid_pad_y + self.task_points_height,
+        window=delete_task_button,
+        anchor="ne",
+        tags=right_tags)
+    # add button to edit task
+    edit_task_button = tk.Button(
+        task_list_canvas,
+        text=self._EDIT_TEXT,
+        command=functools.partial(self.edit_task_row, row_slot))
+    add_button_style(edit_task_button)
+    task_list_canvas.create_window(
+        right_x - self.task_delete_button_width, grid_pad_y + self.task_points_height,
+        window=edit_task_button,
+        anchor="ne",
+        tags=right_tags)
+
+    self.task_list_widgets.append((task_number_text_id, task_visibility_button, task_visibility_window_id, task_points_text_id, edit_task_button, delete_task_button))
+    self.task_row_indices.append(None)
+    self.task_row_visibility_vars.append(task_visibility_var)
+
+  def _bind_task_row(self, row_slot: int, task_index: int):
+    """
+    Show the task with the given index in the reusable row `row_slot` of the task list.
+
+    Args:
+        row_slot (int): The index of the row in the list of reusable rows.
+        task_index (int): The index of the task in `self.task_list`.
+    """
+    self.task_row_indices[row_slot] = task_index
+    task_number_text_id, task_visibility_button, _, task_points_text_id, _, _ = self.task_list_widgets[row_slot]
+    self.task_list_canvas.itemconfigure(task_number_text_id, text=f"{task_index+1}.")
+    task_visibility_button.config(text=self.task_list[task_index].display_name)
+    self.task_row_visibility_vars[row_slot].set(bool(self.task_visibility[task_index]))
+    self.task_list_canvas.itemconfigure(task_points_text_id, text=self.task_list[task_index].get_points_text())
+
+  def _resize_task_rows(self, width: int):
+    """
+    Move the right aligned items of all rows of the task list to the new width of the list and stretch the task names in between.
+
+    Args:
+        width (int): The new width of the task list in pixels.
+    """
+    self.task_list_canvas.move("task_row_right", width - self.task_row_right_x, 0)
+    self.task_row_right_x = width
+    task_name_width: int = max(1, width - self.task_row_right_width - 2*self.grid_pad_x - self.task_name_x)
+    for _, _, task_visibility_window_id, _, _, _ in self.task_list_widgets:
+      self.task_list_canvas.itemconfigure(task_visibility_window_id, width=task_name_width)
 
-    return (task_frame, task_number_label, task_visibility_button, task_points_label, edit_task_button, delete_task_button)
+  def toggle_task_row_visibility(self, row_slot: int):
+    """
+    Toggle the visibility of the task currently shown in the given row of the task list.
+
+    Args:
+        row_slot (int): The index of the row in the list of reusable rows.
+    """
+    task_index: int = self.task_row_indices[row_slot]
+    self.task_visibility[task_index] = self.task_row_visibility_vars[row_slot].get()
+    self.toggle_task_visibility(task_index)
+
+  def sync_task_row_visibility_vars(self):
+    """
+    Update the checkbuttons of the visible rows of the task list after the visibility of several tasks changed. Tasks in hidden rows are updated when their row is shown again (see `_bind_task_row`).
+    """
+    if self.task_list_view is None:
+      return
+    for row_slot, task_index in enumerate(self.task_list_view.slot_indices):
+      if task_index is not None:
+        self.task_row_visibility_vars[row_slot].set(bool(self.task_visibility[task_index]))
+
+  def edit_task_row(self, row_slot: int):
+    """
+    Open edit mode for the task currently shown in the given row of the task list.
+
+    Args:
+        row_slot (int): The index of the row in the list of reusable rows.
+    """
+    self.edit_task(self.task_list[self.task_row_indices[row_slot]])
+
+  def delete_task_row(self, row_slot: int):
+    """
+    Delete the task currently shown in the given row of the task list.
 
-  def get_task_points_label(self, ttr_task):
-      task_points_text = f"points: {ttr_task.points}"
-      if ttr_task.points_bonus is not None: # add task bonus points
-        if ttr_task.points_bonus > 0:
-          task_points_text += " + " + str(ttr_task.points_bonus)
-        elif ttr_task.points_bonus < 0:
-          task_points_text += " - " + str(-ttr_task.points_bonus)
-      return task_points_text
+    Args:
+        row_slot (int): The index of the row in the list of reusable rows.
+    """
+    self.delete_task(self.task_list[self.task_row_indices[row_slot]])
 
   def bind_task_overview_mouse_events(self):
     """
@@ -391,59 +568,87 @@ class Task_Editor_GUI:
       particle.highlight(self.ax)
       self.highlighted_particles.append(particle)
     # hide all tasks
-    self.task_visibility_vars["all"].set(False)
-    self.toggle_all_tasks_visibility(clear_highlighted_particles=False)
+    self.hide_all_tasks()
     # highlight all tasks that start or end at the selected particle
-    for task_name, task in self.particle_graph.tasks.items():
-      if task_name == "all":
-        continue
-      for particle in self.highlighted_particles:
-        if particle.label in (task.node_names[0], task.node_names[-1]):
-          self.task_visibility_vars[task.name].set(True)
-          self.toggle_task_visibility(self.task_visibility_vars[task.name], task, update_canvas=False, update_all_tasks=True)
-
-    self.canvas.draw_idle()
+    highlighted_labels: set[str] = {particle.label for particle in self.highlighted_particles}
+    for task_index, task in enumerate(self.task_list):
+      if task.node_names and (task.node_names[0] in highlighted_labels or task.node_names[-1] in highlighted_labels):
+        self.task_visibility[task_index] = True
+        self.toggle_task_visibility(task_index, update_canvas=False, update_all_tasks=False)
+    self.update_all_tasks_visibility_var()
+    self.sync_task_row_visibility_vars()
+    self.schedule_redraw()
 
 
 
   def calculate_all_task_lengths(self):
     """
-    Calculates the length of all tasks in the task edit frame.
+    Calculates the length of all tasks in the task edit frame. The lengths are calculated in a worker thread and applied to all tasks at once when the calculation is done (see `check_task_lengths_ready`), so the GUI keeps responding in the meantime.
+    """
+    if self.task_length_future is not None:
+      return
+    if self.task_length_executor is None:
+      self.task_length_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    tasks: List[TTR_Task] = list(self.task_list)
+    self.task_length_future = self.task_length_executor.submit(
+        compute_all_task_points,
+        self.networkx_graph,
+        [list(task.node_names) for task in tasks])
+    self.task_length_poll_id = self.master.after(50, self.check_task_lengths_ready, tasks)
+
+  def stop_task_length_calculation(self):
     """
-    for task_list_widgets, (task_name, task) in zip(self.task_list_widgets, self.particle_graph.tasks.items()):
-      if task_name == "all":
+    Discard the task lengths that are still being calculated, cancel the scheduled check for their results and shut down the worker thread. A calculation that already started finishes in the background, but its results are never applied.
+    """
+    if self.task_length_poll_id is not None:
+      self.master.after_cancel(self.task_length_poll_id)
+      self.task_length_poll_id = None
+    self.task_length_future = None
+    if self.task_length_executor is not None:
+      self.task_length_executor.shutdown(wait=False, cancel_futures=True)
+      self.task_length_executor = None
+
+  def check_task_lengths_ready(self, tasks: List[TTR_Task]):
+    """
+    Check whether the worker thread finished calculating the task lengths. If so, update all tasks and the task list in one pass. Otherwise check again later.
+    Tasks whose length could not be calculated (e.g. because there is no path between their locations) keep their previous length and points and are reported in a warning.
+
+    Args:
+        tasks (List[TTR_Task]): tasks whose lengths are calculated, in the same order as the results.
+    """
+    self.task_length_poll_id = None
+    task_length_future: concurrent.futures.Future = self.task_length_future
+    if task_length_future is None: # calculation was discarded
+      return
+    if not task_length_future.done():
+      self.task_length_poll_id = self.master.after(50, self.check_task_lengths_ready, tasks)
+      return
+    self.task_length_future = None
+    all_task_points: List[Union[Tuple[int, int, int, int], None]] = task_length_future.result()
+    failed_task_names: List[str] = []
+    for task, task_points in zip(tasks, all_task_points):
+      if task_points is None: # keep the previous length and points of tasks that could not be calculated
+        failed_task_names.append(task.name)
         continue
-      self.calculate_update_task_length(task, task_points_vars=None)
-      task_list_widgets[3].config(text=self.get_task_points_label(task))
+      self.apply_task_points(task, task_points, task_points_vars=None)
+    if failed_task_names:
+      print(f"Warning: Could not calculate the length of {len(failed_task_names)} task(s): {', '.join(failed_task_names)}")
+    # update the points labels of the visible tasks
+    if self.task_list_view is not None:
+      self.task_list_view.refresh()
 
   def calculate_task_length(self, task: TTR_Task, include_bonus_points: bool = True) -> int:
     """
-    Calculates the length of the given task based on the current networkx graph based on the current particle graph.
-    If a task has less than 2 nodes, the length is None.
-    If a task has exactly 2 nodes, the length is the shortest path length between the two nodes.
-    If a task has more than two nodes and `include_bonus_points` is False, return the minimum length to connect all nodes to each other (Steiner Tree problem). This is only an approximate solution calculated with networkx's `steiner_tree` method and may not be optimal.
-    If a task has more than 2 nodes and `include_bonus_points` is True, the returned length is the sum of all shortest path lengths between the nodes in order. This may not be the shortest set of edges connecting all nodes, but ensures correct order. Reordering the nodes can significantly change the length of the task. Overlapping edges of shortest paths between different node pairs are counted multiple times.
+    Calculates the length of the given task based on the current networkx graph based on the current particle graph (see `compute_task_length`).
 
     Args:
         task (TTR_Task): Task to calculate the length for.
-        include_bonus_points (bool, optional): If False, only consider first and last node of the task. Otherwise calculate length as described above. Defaults to True.
+        include_bonus_points (bool, optional): If False, only consider first and last node of the task. Otherwise calculate length as described in `compute_task_length`. Defaults to True.
 
     Returns:
         int: Length of the task.
     """
-    if len(task.node_names) < 2:
-      return 0
-    elif len(task.node_names) == 2:# or not include_bonus_points:
-      return nx.shortest_path_length(self.networkx_graph, task.node_names[0], task.node_names[-1], weight="length")
-    elif len(task.node_names) > 2 and not include_bonus_points:
-      # TODO: implement optimal Steiner-Tree solver: https://chatgpt.com/share/39b0e6c3-fd1f-4828-bc54-b70631aaf692
-      min_length_to_connect_nodes: int = nx.algorithms.approximation.steiner_tree(self.networkx_graph, task.node_names, weight="weight", method="mehlhorn").size("length")
-      return int(min_length_to_connect_nodes)
-    else: # return sum of all path lengths between all nodes assuming them to be ordered to achieve the shortest path
-      length: int = 0
-      for node_1, node_2 in zip(task.node_names[:-1], task.node_names[1:]):
-        length += nx.shortest_path_length(self.networkx_graph, node_1, node_2, weight="length")
-      return length
+    return compute_task_length(self.networkx_graph, task.node_names, include_bonus_points)
 
   def calculate_update_task_length(self, task: TTR_Task, task_points_vars: List[tk.IntVar]):
     """
@@ -454,25 +659,28 @@ class Task_Editor_GUI:
         task_points_vars (List[tk.IntVar]): List of IntVars that store the task's node names or None.
             If None, no variables are updated with the new points and length values.
     """
-    # calculate and update task length
-    bonus_task_length = self.calculate_task_length(task, include_bonus_points=True)
-    task.set_length(bonus_task_length)
-    # use length to calculate task points
-    if len(task.node_names) < 2:
-      task.set_points(points=0, points_bonus=0, points_penalty=0)
-      for points_var in task_points_vars[1:]:
-        points_var.set(0)
-    elif len(task.node_names) == 2:
-      task.set_points(
-          points=bonus_task_length,
-          points_bonus=0,
-          points_penalty=-bonus_task_length)
-    else:
-      no_bonus_task_length = self.calculate_task_length(task, include_bonus_points=False)
-      task.set_points(
-          points=no_bonus_task_length,
-          points_bonus=int((bonus_task_length - no_bonus_task_length) * 1.3),
-          points_penalty=-int(bonus_task_length * 1.2))
+    task_points: Tuple[int, int, int, int] = compute_task_points(self.networkx_graph, task.node_names)
+    self.apply_task_points(task, task_points, task_points_vars)
+
+  def apply_task_points(self,
+      task: TTR_Task,
+      task_points: Tuple[int, int, int, int],
+      task_points_vars: List[tk.IntVar]):
+    """
+    Set the length and points of the given task.
+
+    Args:
+        task (TTR_Task): Task to update.
+        task_points (Tuple[int, int, int, int]): length, points, bonus points and penalty points of the task (see `compute_task_points`).
+        task_points_vars (List[tk.IntVar]): List of IntVars that store the task's length and points or None.
+            If None, no variables are updated with the new points and length values.
+    """
+    length, points, points_bonus, points_penalty = task_points
+    task.set_length(length)
+    task.set_points(
+        points=points,
+        points_bonus=points_bonus,
+        points_penalty=points_penalty)
 
     if task_points_vars is not None:
       assert len(task_points_vars) == 4
@@ -482,19 +690,22 @@ class Task_Editor_GUI:
       task_points_vars[3].set(task.points_penalty)
 
   def calculate_all_task_names(self):
-    for i, (task_list_widgets, (task_name, task)) in enumerate(
-            zip(self.task_list_widgets, self.particle_graph.tasks.items())):
-      if task_name == "all" or task.automatic_name == False:
+    renamed_tasks: bool = False
+    for i, task in enumerate(list(self.task_list)):
+      if task.automatic_name == False:
         continue
       old_name: str = task.name
       new_name: str = task.calculate_task_name(self.particle_graph)
       if new_name != old_name:
         print(f"{i+1}. Task name changed from '{old_name}' to '{new_name}'.")
-        # update task name in UI task list
-        task_list_widgets[2].config(text=new_name.replace(" - ", "\n"))
         # update task name in particle graph
-        self.particle_graph.tasks[new_name] = self.particle_graph.tasks.pop(old_name)
-        self.task_visibility_vars[new_name] = self.task_visibility_vars.pop(old_name)
+        if self.particle_graph.tasks.get(old_name) is task:
+          del self.particle_graph.tasks[old_name]
+        self.add_task_to_graph(task)
+        renamed_tasks = True
+    # update task names in UI task list
+    if renamed_tasks:
+      self.sync_task_model()
 
   def calculate_task_name(self, task: TTR_Task):
     """
@@ -515,49 +726,76 @@ class Task_Editor_GUI:
 
   def toggle_all_tasks_visibility(self, clear_highlighted_particles: bool = True):
     """
-    Toggles the visibility of all tasks.
+    Toggles the visibility of all tasks. Only tasks whose visibility changes are drawn or erased.
     """
-    for task_name, task_var in self.task_visibility_vars.items():
-      if task_name != "all":
-        task_var.set(self.task_visibility_vars["all"].get())
-        self.toggle_task_visibility(task_var, self.particle_graph.tasks[task_name], update_canvas=False, update_all_tasks=False)
+    show_tasks: bool = self.all_tasks_visibility_var.get()
+    for task_index in np.flatnonzero(self.task_visibility != show_tasks):
+      self.task_visibility[task_index] = show_tasks
+      self.toggle_task_visibility(task_index, update_canvas=False, update_all_tasks=False)
+    self.sync_task_row_visibility_vars()
     if clear_highlighted_particles:
       # clear highlighted particles if all tasks are 
       for particle in self.highlighted_particles:
         particle.remove_highlight(self.ax)
       self.highlighted_particles: List[Particle_Node] = []
-    self.canvas.draw_idle()
+    self.schedule_redraw()
 
-  def toggle_task_visibility(self, task_visibility_var: tk.BooleanVar, task: TTR_Task, update_canvas: bool = True, update_all_tasks: bool = True):
+  def hide_all_tasks(self):
     """
-    Toggles the visibility of the given task.
-    If all task visibility variables were True and this one is now False, uncheck the "Show/hide all" checkbutton.
-    If all task visibility variables are now True, check the "Show/hide all" checkbutton.
+    Erase all visible tasks and uncheck all task checkbuttons. The canvas is not redrawn.
     """
-    if task_visibility_var.get():
-      task.erase()
+    for task_index in np.flatnonzero(self.task_visibility):
+      self.task_list[task_index].erase()
+    self.task_visibility[:] = False
+    self.all_tasks_visibility_var.set(False)
+    self.sync_task_row_visibility_vars()
+
+  def toggle_task_visibility(self, task_index: int, update_canvas: bool = True, update_all_tasks: bool = True):
+    """
+    Draws or erases the task with the given index according to `self.task_visibility`.
+    If `update_all_tasks` is True, check the "Show/hide all" checkbutton if and only if all tasks are now visible.
+
+    Args:
+        task_index (int): index of the task in `self.task_list`
+        update_canvas (bool, optional): whether to redraw the canvas. Defaults to True.
+        update_all_tasks (bool, optional): whether to update the "Show/hide all" checkbutton. Defaults to True.
+    """
+    task: TTR_Task = self.task_list[task_index]
+    task.erase()
+    if self.task_visibility[task_index]:
       task.draw(self.ax, self.particle_graph)
-    else:
-      task.erase()
-    # check if all tasks are now visible
     if update_all_tasks:
-      all_tasks_visible = True
-      for task_name, task_var in self.task_visibility_vars.items():
-        if task_name != "all" and not task_var.get():
-          all_tasks_visible = False
-          self.task_visibility_vars["all"].set(False)
-          break
-      else:
-        self.task_visibility_vars["all"].set(True)
+      self.update_all_tasks_visibility_var()
     if update_canvas:
-      self.canvas.draw_idle()
+      self.schedule_redraw()
+
+  def update_all_tasks_visibility_var(self):
+    """
+    Check the "Show/hide all" checkbutton if and only if all tasks are visible.
+    """
+    self.all_tasks_visibility_var.set(bool(self.task_visibility.all()))
+
+  def schedule_redraw(self):
+    """
+    Redraw the canvas once the Tk event loop is idle. Several visibility changes in a row (e.g. clicking several task checkbuttons quickly) only cause a single redraw.
+    """
+    if not self._redraw_scheduled:
+      self._redraw_scheduled = True
+      self.master.after_idle(self.apply_scheduled_redraw)
+
+  def apply_scheduled_redraw(self):
+    """
+    Redraw the canvas after visibility changes (see `schedule_redraw`).
+    """
+    self._redraw_scheduled = False
+    self.canvas.draw_idle()
 
 
   def edit_task(self, task: TTR_Task):
     """
     Open edit mode for the given task.
 
-    1. Clear the task edit frame
+    1. Hide the task overview
     2. Create headline for edit mode
     3. Show task location widgets
     4. Show task length/ points widgets
@@ -568,20 +806,26 @@ class Task_Editor_GUI:
     """
     self.unbind_task_overview_mouse_events()
     # hide all tasks
-    for task_name, task_var in self.task_visibility_vars.items():
-      if task_name != "all" and task_var.get():
-        self.particle_graph.tasks[task_name].erase()
-        task_var.set(False)
+    self.hide_all_tasks()
     # task.draw(self.ax, self.particle_graph)
     self.task_node_indices: List[int] = [] # indices of the nodes in the task
     self.task_location_widgets: List[Tuple[tk.Label, tk.Frame, tk.Button, tk.Label, tk.Button, tk.Button]] = []
     task_points_vars: List[tk.IntVar] = [] # variables for task length and points
-    # 1. Clear the task edit frame
-    self.clear_task_edit_frame()
+    # 1. Hide the task overview and create a frame for the task details
+    self.task_overview_frame.grid_remove()
+    self.task_details_frame = tk.Frame(self.task_content_frame)
+    self.add_frame_style(self.task_details_frame)
+    self.task_details_frame.grid(
+        row=1,
+        column=0,
+        sticky="nsew",
+        padx=0,
+        pady=0)
+    self.task_details_frame.grid_columnconfigure(0, weight=1)
     row_index: int = 0
     # 2. Create headline for edit mode
     edit_mode_headline = tk.Label(
-        self.task_edit_frame,
+        self.task_details_frame,
         text="Edit Task")
     self.add_label_style(edit_mode_headline, font_type="bold")
     edit_mode_headline.grid(
@@ -593,7 +837,7 @@ class Task_Editor_GUI:
         pady=(self.grid_pad_y, 0))
     row_index += 1
     # 3. Show task name input
-    task_name_frame = tk.Frame(self.task_edit_frame)  # New frame for task name
+    task_name_frame = tk.Frame(self.task_details_frame)  # New frame for task name
     self.add_frame_style(task_name_frame)
     task_name_frame.grid(row=row_index, column=0, columnspan=2, sticky="new", padx=self.grid_pad_x, pady=self.grid_pad_y)
     
@@ -618,7 +862,7 @@ class Task_Editor_GUI:
     # 4. Show task location widgets
     # 4.1. Show task location headline
     task_location_headline = tk.Label(
-        self.task_edit_frame,
+        self.task_details_frame,
         text="Task Locations")
     self.add_label_style(task_location_headline)
     task_location_headline.grid(
@@ -630,7 +874,7 @@ class Task_Editor_GUI:
         pady=(self.grid_pad_y, 0))
     row_index += 1
     # 4.2. Show task location widgets
-    self.task_locations_frame: tk.Frame = tk.Frame(self.task_edit_frame)
+    self.task_locations_frame: tk.Frame = tk.Frame(self.task_details_frame)
     self.add_frame_style(self.task_locations_frame)
     self.task_locations_frame.grid(
         row=row_index,
@@ -647,7 +891,7 @@ class Task_Editor_GUI:
     self.canvas.draw_idle()
     # 4.3. Show button to add new task location
     self.add_task_location_button = tk.Button(
-        self.task_edit_frame,
+        self.task_details_frame,
         text="Add Location",
         command=lambda task_index=location_index+1: self.add_task_location(
             task_index,
@@ -665,7 +909,7 @@ class Task_Editor_GUI:
     # 5. Show task length/ points widgets
     # 5.1. Create task points headline
     task_length_headline = tk.Label(
-        self.task_edit_frame,
+        self.task_details_frame,
         text="Task points")
     self.add_label_style(task_length_headline)
     task_length_headline.grid(
@@ -676,7 +920,7 @@ class Task_Editor_GUI:
         pady=(self.grid_pad_y, 0))
     # 5.2. Create button to calculate task length
     calculate_task_length_button = tk.Button(
-        self.task_edit_frame,
+        self.task_details_frame,
         text="Calculate task length",
         command=lambda task=task, task_points_vars=task_points_vars: self.calculate_update_task_length(task, task_points_vars))
     self.add_button_style(calculate_task_length_button)
@@ -688,7 +932,7 @@ class Task_Editor_GUI:
         pady=(self.grid_pad_y, 0))
     row_index += 1
     # 5.3. Create task points 
-    task_points_frame: tk.Frame = tk.Frame(self.task_edit_frame)
+    task_points_frame: tk.Frame = tk.Frame(self.task_details_frame)
     self.add_frame_style(task_points_frame)
     task_points_frame.grid(
         row=row_index,
@@ -761,7 +1005,7 @@ class Task_Editor_GUI:
     task_points_vars.append(task_penalty_points_var)
     # 6. Show task edit buttons
     # 6.1 Create task edit buttons frame
-    task_edit_buttons_frame: tk.Frame = tk.Frame(self.task_edit_frame)
+    task_edit_buttons_frame: tk.Frame = tk.Frame(self.task_details_frame)
     self.add_frame_style(task_edit_buttons_frame)
     task_edit_buttons_frame.grid(
         row=row_index,
@@ -792,10 +1036,7 @@ class Task_Editor_GUI:
         text="Abort",
         command=lambda task_points_vars=task_points_vars, task_node_indices=self.task_node_indices: self.cancel_task_changes(task_points_vars, task_node_indices))
     self.add_button_style(cancel_changes_button)
-    cancel_changes_button.config(
-        background=self.color_config["delete_button_bg_color"],
-        foreground=self.color_config["delete_button_fg_color"]
-    )
+    cancel_changes_button.config(**self.delete_button_kwargs)
     cancel_changes_button.grid(
         row=0,
         column=1,
@@ -878,20 +1119,8 @@ class Task_Editor_GUI:
     """
     node_number_label = tk.Label(self.task_locations_frame, text=f"{location_index + 1}.")
     self.add_label_style(node_number_label, font_type="bold")
-    node_number_label.grid(
-        row=location_index,
-        column=0,
-        sticky="w",
-        padx=self.grid_pad_x,
-        pady=(0, self.grid_pad_y))
     node_selector_frame = tk.Frame(self.task_locations_frame)
     self.add_frame_style(node_selector_frame)
-    node_selector_frame.grid(
-        row=location_index,
-        column=1,
-        sticky="w",
-        padx=0,
-        pady=(0, self.grid_pad_y))
     # display the name of the currently selected node
     # add node to highlighted particles
     self.task_node_indices.append(self.node_names.index(location_name))
@@ -900,12 +1129,6 @@ class Task_Editor_GUI:
       self.highlighted_particles[-1].highlight(self.ax)
     selected_node_indicator = tk.Label(node_selector_frame, text=location_name, width = max([len(name) for name in self.node_names]), cursor="hand2")
     self.add_label_style(selected_node_indicator, font_type="italic")
-    selected_node_indicator.grid(
-        row=0,
-        column=1,
-        sticky="w",
-        padx=0,
-        pady=(0, self.grid_pad_y))
     # add bindings to change text of the label (mousewheel and buttons)
     selected_node_indicator.bind(
         "<MouseWheel>",
@@ -921,35 +1144,25 @@ class Task_Editor_GUI:
             self.change_node_label(1, location_indicator_index))
     # add arrow buttons to change the selected node
     left_arrow_button = self.add_arrow_button("left", node_selector_frame, lambda location_indicator_index=location_index: self.change_node_label(1, location_indicator_index))
-    left_arrow_button.grid(
-        row=0,
-        column=0,
-        sticky="e",
-        padx=0,
-        pady=0)
     right_arrow_button = self.add_arrow_button("right", node_selector_frame, lambda location_indicator_index=location_index: self.change_node_label(-1, location_indicator_index))
-    right_arrow_button.grid(
-        row=0,
-        column=2,
-        sticky="w",
-        padx=0,
-        pady=0)
     # add button to remove the location
     remove_location_button = tk.Button(
         node_selector_frame,
         text="Remove",
         command=lambda task_index=location_index: self.remove_task_location(task_index))
     self.add_button_style(remove_location_button)
-    remove_location_button.config(
-      background=self.color_config["delete_button_bg_color"],
-      foreground=self.color_config["delete_button_fg_color"]
-    )
-    remove_location_button.grid(
-        row=0,
-        column=3,
-        sticky="w",
-        padx=(self.grid_pad_x, 0),
-        pady=0)
+    remove_location_button.config(**self.delete_button_kwargs)
+    # place all widgets of the row in one pass. The selector frame is attached to the locations frame last, after its children were placed.
+    grid_specs: List[Tuple[tk.Widget, dict]] = [
+        (left_arrow_button, dict(row=0, column=0, sticky="e", padx=0, pady=0)),
+        (selected_node_indicator, dict(row=0, column=1, sticky="w", padx=0, pady=self.grid_pad_bottom)),
+        (right_arrow_button, dict(row=0, column=2, sticky="w", padx=0, pady=0)),
+        (remove_location_button, dict(row=0, column=3, sticky="w", padx=self.grid_pad_left, pady=0)),
+        (node_number_label, dict(row=location_index, column=0, sticky="w", padx=self.grid_pad_x, pady=self.grid_pad_bottom)),
+        (node_selector_frame, dict(row=location_index, column=1, sticky="w", padx=0, pady=self.grid_pad_bottom)),
+    ]
+    for widget, grid_kwargs in grid_specs:
+      widget.grid(**grid_kwargs)
     self.task_location_widgets.append(
       (node_number_label, node_selector_frame, left_arrow_button, selected_node_indicator, right_arrow_button, remove_location_button)
     )
@@ -1036,7 +1249,7 @@ class Task_Editor_GUI:
 
   def apply_task_changes(self, task: TTR_Task, task_points_vars: List[tk.IntVar], task_node_indices: List[int]):
     """
-    Apply changes to the currently selected task. If it did not exist before, add it to the task list. Then re-open the task overview.
+    Apply changes to the currently selected task. If it did not exist before, add it to the task list. Then return to the task overview and update only the changed task in the task list.
 
     Args:
         task (TTR_Task): task to change
@@ -1047,10 +1260,10 @@ class Task_Editor_GUI:
     new_node_names: List[str] = [self.node_names[i] for i in task_node_indices if i != 0] # remove the placeholder "None" (index 0)
     # update task nodes and name
     updated_name = False
-    if task.is_empty():
+    is_new_task: bool = task.is_empty()
+    if is_new_task:
       task.set_node_names(new_node_names, update_name=True)
-      self.particle_graph.tasks[task.name] = task
-      self.task_list.append(task) # potentially unnecessary
+      self.add_task_to_graph(task)
     if task.name != self.task_name_entry.get():
       task.overwrite_name(self.task_name_entry.get())
       updated_name = True
@@ -1060,22 +1273,24 @@ class Task_Editor_GUI:
       # print(f"adding task {task.name} with nodes {task.node_names}")
       if task.name != self.current_old_task_name:
         updated_name = True
-    if updated_name:
-      self.particle_graph.tasks[task.name] = task # update task key in task list
-      self.task_visibility_vars[task.name] = self.task_visibility_vars[self.current_old_task_name] # update task key in task visibility list
-      del self.particle_graph.tasks[self.current_old_task_name]
-      del self.task_visibility_vars[self.current_old_task_name]
+    if updated_name: # update task key in particle graph
+      if self.particle_graph.tasks.get(self.current_old_task_name) is task:
+        del self.particle_graph.tasks[self.current_old_task_name]
+      self.add_task_to_graph(task)
     # update task points
     task.set_length(task_points_vars[0].get())
     task.set_points(*[var.get() for var in task_points_vars[1:]])
-    # remove highlights from selected nodes
+    # remove highlights from selected nodes and go back to the task overview
     self.cancel_task_changes(task_points_vars, task_node_indices)
-    # clear the task frame and go back to the task overview
-    self.open_task_overview()
+    # only update the changed task in the task list unless tasks were added or renamed
+    if is_new_task or updated_name:
+      self.sync_task_model()
+    else:
+      self.update_task_model(self.task_list.index(task))
 
   def cancel_task_changes(self, task_points_vars: List[tk.IntVar], task_node_indices: List[int]):
     """
-    Abort changing the currently selected task. Then re-open the task overview.
+    Abort changing the currently selected task. Then return to the task overview.
 
     Args:
         task_points_vars (List[tk.IntVar]): list of IntVars for the task points (these will be deleted)
@@ -1091,8 +1306,18 @@ class Task_Editor_GUI:
     for task_points_var in task_points_vars:
       del task_points_var
     self.unbind_task_edit_mouse_events()
-    # clear the task frame and go back to the task overview
-    self.open_task_overview()
+    # remove the task details and go back to the task overview
+    self.return_to_task_overview()
+
+  def return_to_task_overview(self):
+    """
+    Remove the task details and show the task overview again. The overview is only hidden while a task is edited, so it does not need to be rebuilt.
+    """
+    if self.task_details_frame is not None:
+      self.task_details_frame.destroy()
+      self.task_details_frame = None
+    self.task_overview_frame.grid()
+    self.bind_task_overview_mouse_events()
 
   def add_int_input(self,
       partent: tk.Widget,
@@ -1207,48 +1432,24 @@ class Task_Editor_GUI:
     self.canvas.draw_idle()
 
 
-  def delete_task(self, task: TTR_Task, task_index: int):
+  def delete_task(self, task: TTR_Task):
     """
     Deletes the given task:
     - if it was shown, remove it from the canvas
-    - remove the corresponding task visibility variable
+    - remove its visibility state
     - remove it from the particle graph
     - remove it from the task edit frame
     - update number labels of all other tasks in list
 
     Args:
         task (TTR_Task): task to delete
-        task_index (int): index of the task in the task list
     """
-    # remove the task from the canvas
-    if self.task_visibility_vars[task.name].get():
-      task.erase()
-      self.canvas.draw_idle()
+    if self.particle_graph.tasks.get(task.name) is task:
+      del self.particle_graph.tasks[task.name]
     else:
-      # check if all task toggle needs to be activated if a hidden task is deleted
-      for task_name, task_visibility_var in self.task_visibility_vars.items():
-        if task_name not in ("all", task.name) and not task_visibility_var.get():
-          break
-      else:
-        self.task_visibility_vars["all"].set(True)
-    # remove the task from the list of highlighted tasks
-    del self.task_visibility_vars[task.name]
-    del self.particle_graph.tasks[task.name]
-    self.task_list.pop(task_index)
-    # remove the task widgets from the frame
-    deleted_task_widgets = self.task_list_widgets.pop(task_index)
-    for widget in deleted_task_widgets[:2]:
-      widget.destroy()
-    # update the task number labels
-    for row_index, task_widgets in enumerate(self.task_list_widgets[task_index:]):
-      row_index += task_index
-      # move frame one row up
-      task_widgets[0].grid_remove()
-      task_widgets[0].grid(row=row_index)
-      # change task number in label
-      task_widgets[1].config(text=f"{row_index+1}.")
-      # update task delete button command
-      task_widgets[5].config(command=lambda task=self.task_list[row_index], task_index=row_index: self.delete_task(task, task_index))
+      print(f"Warning: Could not delete task '{task.name}' because it is not in the particle graph.")
+    # erases the task if it was shown, updates the "Show/hide all" checkbutton and the numbers of all following tasks
+    self.sync_task_model()
 
 
   def add_arrow_button(self, direction: str, parent_frame: tk.Frame, command: Callable) -> tk.Button:
@@ -1300,3 +1501,80 @@ def change_edge_length(change_direction: int, int_var: tk.IntVar) -> None:
     int_var.set(current_value - 1)
   else:
     return # no change
+
+
+def compute_task_length(networkx_graph: nx.Graph, node_names: List[str], include_bonus_points: bool = True) -> int:
+  """
+  Calculates the length of a task with the given nodes in the given networkx graph.
+  If a task has less than 2 nodes, the length is 0.
+  If a task has exactly 2 nodes, the length is the shortest path length between the two nodes.
+  If a task has more than two nodes and `include_bonus_points` is False, return the minimum length to connect all nodes to each other (Steiner Tree problem). This is only an approximate solution calculated with networkx's `steiner_tree` method and may not be optimal.
+  If a task has more than 2 nodes and `include_bonus_points` is True, the returned length is the sum of all shortest path lengths between the nodes in order. This may not be the shortest set of edges connecting all nodes, but ensures correct order. Reordering the nodes can significantly change the length of the task. Overlapping edges of shortest paths between different node pairs are counted multiple times.
+
+  This function does not access any tkinter objects, so it can be run in a worker thread.
+
+  Args:
+      networkx_graph (nx.Graph): graph of all locations and paths
+      node_names (List[str]): names of the task's nodes
+      include_bonus_points (bool, optional): If False, only consider first and last node of the task. Otherwise calculate length as described above. Defaults to True.
+
+  Returns:
+      int: Length of the task.
+  """
+  if len(node_names) < 2:
+    return 0
+  elif len(node_names) == 2:# or not include_bonus_points:
+    return nx.shortest_path_length(networkx_graph, node_names[0], node_names[-1], weight="length")
+  elif len(node_names) > 2 and not include_bonus_points:
+    # TODO: implement optimal Steiner-Tree solver: https://chatgpt.com/share/39b0e6c3-fd1f-4828-bc54-b70631aaf692
+    min_length_to_connect_nodes: int = nx.algorithms.approximation.steiner_tree(networkx_graph, node_names, weight="weight", method="mehlhorn").size("length")
+    return int(min_length_to_connect_nodes)
+  else: # return sum of all path lengths between all nodes assuming them to be ordered to achieve the shortest path
+    length: int = 0
+    for node_1, node_2 in zip(node_names[:-1], node_names[1:]):
+      length += nx.shortest_path_length(networkx_graph, node_1, node_2, weight="length")
+    return length
+
+def compute_task_points(networkx_graph: nx.Graph, node_names: List[str]) -> Tuple[int, int, int, int]:
+  """
+  Calculates the length and points of a task with the given nodes.
+
+  Args:
+      networkx_graph (nx.Graph): graph of all locations and paths
+      node_names (List[str]): names of the task's nodes
+
+  Returns:
+      Tuple[int, int, int, int]: length, points, bonus points and penalty points of the task
+  """
+  bonus_task_length: int = compute_task_length(networkx_graph, node_names, include_bonus_points=True)
+  # use length to calculate task points
+  if len(node_names) < 2:
+    return bonus_task_length, 0, 0, 0
+  elif len(node_names) == 2:
+    return bonus_task_length, bonus_task_length, 0, -bonus_task_length
+  no_bonus_task_length: int = compute_task_length(networkx_graph, node_names, include_bonus_points=False)
+  return (
+      bonus_task_length,
+      no_bonus_task_length,
+      int((bonus_task_length - no_bonus_task_length) * 1.3),
+      -int(bonus_task_length * 1.2))
+
+def compute_all_task_points(networkx_graph: nx.Graph, all_node_names: List[List[str]]) -> List[Union[Tuple[int, int, int, int], None]]:
+  """
+  Calculates the lengths and points of several tasks (see `compute_task_points`). This is meant to be run in a worker thread.
+  A task that cannot be calculated (e.g. because its locations are not connected or no longer exist) does not affect the other tasks.
+
+  Args:
+      networkx_graph (nx.Graph): graph of all locations and paths
+      all_node_names (List[List[str]]): names of the nodes of each task
+
+  Returns:
+      List[Union[Tuple[int, int, int, int], None]]: length, points, bonus points and penalty points of each task, None for tasks that could not be calculated
+  """
+  all_task_points: List[Union[Tuple[int, int, int, int], None]] = []
+  for node_names in all_node_names:
+    try:
+      all_task_points.append(compute_task_points(networkx_graph, node_names))
+    except nx.NetworkXException:
+      all_task_points.append(None)
+  return all_task_points
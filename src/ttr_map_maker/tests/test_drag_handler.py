@@ -0,0 +1,45 @@
+import os
+import sys
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from drag_handler import Drag_Handler
+from graph_particle import Graph_Particle
+
+
+def create_drag_handler(particle_list, cell_size=None):
+  figure, axes = plt.subplots()
+  drag_handler = Drag_Handler(figure.canvas, axes, particle_list, cell_size=cell_size)
+  return drag_handler, figure
+
+
+def check_moved_particle_next_to_unmoved_particle(cell_size):
+  """
+  A moves from (10, 10) to (0, 0) without updating the drag handler, B stays at (1.5, 0).
+  Clicking at (0, 0) must pick A even though the cached nearest particle (B) did not move.
+  """
+  particle_a = Graph_Particle(0, position=np.array([10, 10], dtype=np.float64))
+  particle_b = Graph_Particle(1, position=np.array([1.5, 0], dtype=np.float64))
+  drag_handler, figure = create_drag_handler([particle_a, particle_b], cell_size=cell_size)
+  particle_a.set_position(np.array([0, 0], dtype=np.float64))
+  assert drag_handler.find_particle(np.array([0, 0], dtype=np.float64)) is particle_a
+  plt.close(figure)
+
+
+def test_find_moved_particle_kdtree():
+  check_moved_particle_next_to_unmoved_particle(cell_size=None)
+
+
+def test_find_moved_particle_cell_list():
+  check_moved_particle_next_to_unmoved_particle(cell_size=2.)
+
+
+def test_find_particle_out_of_range():
+  particle_a = Graph_Particle(0, position=np.array([10, 10], dtype=np.float64))
+  drag_handler, figure = create_drag_handler([particle_a])
+  assert drag_handler.find_particle(np.array([0, 0], dtype=np.float64)) is None
+  plt.close(figure)
@@ -79,10 +79,12 @@ class TTR_Particle_Graph:
     self.paths: List[Tuple[str, str, int, str]] = paths
     if tasks and isinstance(tasks, (list, tuple)) and isinstance(tasks[0], (tuple, list)):
       self.tasks: dict[str, TTR_Task] = {}
-      for task in tasks:
-        self.tasks[task.name] = TTR_Task([task[0], task[-1]])
+      for location_names in tasks:
+        new_task: TTR_Task = TTR_Task([location_names[0], location_names[-1]])
+        self.tasks[new_task.name] = new_task
       print(f"Converted tasks given as tuples to TTR_Task objects.")
-    self.tasks:  dict[str, TTR_Task] = tasks
+    else:
+      self.tasks:  dict[str, TTR_Task] = tasks
     self.project_setup_dict: dict = self.setup_project_dict() if project_setup is None else project_setup
     # fill in missing keys with default values
     default_project_setup = self.setup_project_dict()
@@ -348,15 +350,30 @@ class TTR_Particle_Graph:
         dt (float, optional): timestep. Defaults to 0.02.
     """
     all_particles = self.get_particle_list()
+    all_edges: List[Particle_Edge] = list(self.particle_edges.values())
+    connected_edge_pairs: List[Tuple[Particle_Edge, Particle_Edge]] = [
+        (particle_edge, connected_particle)
+        for particle_edge in all_edges
+        for connected_particle in particle_edge.connected_particles
+        if isinstance(connected_particle, Particle_Edge)]
     for i in range(iterations):
       for particle in all_particles:
         particle.reset_acceleration()
-
-      for particle_1 in all_particles:
-        for particle_2 in all_particles:
-          if particle_1 != particle_2:
-            particle_1.interact(particle_2)
-
+      try:
+        # precompute attraction forces between all connected edges in one pass
+        edge_forces, edge_anchors = Particle_Edge.compute_edge_attraction_forces(connected_edge_pairs)
+        for (edge_1, edge_2), force, anchor in zip(connected_edge_pairs, edge_forces, edge_anchors):
+          edge_1.edge_attraction_cache[edge_2] = (force, anchor)
+
+        for particle_1 in all_particles:
+          for particle_2 in all_particles:
+            if particle_1 != particle_2:
+              particle_1.interact(particle_2)
+      finally:
+        # positions change during the update, so the precomputed forces become invalid.
+        # Also clear them if an interaction failed, so they are not used by later calls of `get_edge_attraction_force`.
+        for particle_edge in all_edges:
+          particle_edge.edge_attraction_cache.clear()
       for particle in all_particles:
         particle.update(dt)
 
@@ -575,15 +592,15 @@ class TTR_Particle_Graph:
     if np.linalg.norm(edge_particles[0].position - node_1.position) > np.linalg.norm(edge_particles[0].position - node_2.position):
       edge_particles.reverse()
     if length == 1: # handle length 1 connections
-      edge_particles[0].connected_particles = [node_1, node_2]
+      edge_particles[0].set_connected_particles([node_1, node_2])
       return
     for i, edge_particle in enumerate(edge_particles):
         if i == 0:
-            edge_particle.connected_particles = [node_1, edge_particles[i+1]]
+            edge_particle.set_connected_particles([node_1, edge_particles[i+1]])
         elif i == length - 1:
-            edge_particle.connected_particles = [edge_particles[i-1], node_2]
+            edge_particle.set_connected_particles([edge_particles[i-1], node_2])
         else:
-            edge_particle.connected_particles = [edge_particles[i-1], edge_particles[i+1]]
+            edge_particle.set_connected_particles([edge_particles[i-1], edge_particles[i+1]])
 
   def scale_graph_positions(self, ax: plt.Axes, scale_factor: float = 0.8) -> None:
     """
@@ -1381,8 +1398,9 @@ class TTR_Particle_Graph:
         new_node_names = [new_name if x == old_name else x for x in task.node_names]
         task.set_node_names(new_node_names, update_name=True)
         modified_tasks[task_key] = (task.name, task)
-    for old_task_key, (new_task_key, task) in modified_tasks.items():
+    for old_task_key in modified_tasks:
       del self.tasks[old_task_key]
+    for new_task_key, task in modified_tasks.values():
       self.tasks[new_task_key] = task
         
 
@@ -41,10 +41,12 @@ class TTR_Task:
       self.name = "_empty_task_"
     else:
       self.name = name if name is not None else f"{node_names[0]} - {node_names[-1]}"
+    self.display_name: str = self.name.replace(" - ", "\n") # name shown in the task list, one line per location
     self.length: int = length
     self.points: int = points if points is not None else len(node_names)
     self.points_bonus: int = points_bonus
     self.points_penalty: int = points_penalty
+    self._points_text: str = None # cached result of `get_points_text()`
     self.plotted_objects: List[plt.Line2D] = []
     self.automatic_name: bool = True
 
@@ -53,6 +55,7 @@ class TTR_Task:
     self.node_names = node_names
     if update_name:
       self.name = f"{node_names[0]} - {node_names[-1]}"
+      self.display_name = self.name.replace(" - ", "\n")
 
   def set_length(self, length: int) -> None:
     """
@@ -77,6 +80,24 @@ class TTR_Task:
     self.points = points
     self.points_bonus = points_bonus
     self.points_penalty = points_penalty
+    self._points_text = None
+
+  def get_points_text(self) -> str:
+    """
+    Get a text describing the points of the task, e.g. "points: 5 + 3" for a task with bonus points. The text is cached until the points are changed with `set_points()`.
+
+    Returns:
+        str: The points text.
+    """
+    if self._points_text is None:
+      points_text = f"points: {self.points}"
+      if self.points_bonus is not None: # add task bonus points
+        if self.points_bonus > 0:
+          points_text += " + " + str(self.points_bonus)
+        elif self.points_bonus < 0:
+          points_text += " - " + str(-self.points_bonus)
+      self._points_text = points_text
+    return self._points_text
 
 
   def calculate_task_name(self, particle_graph: "TTR_Particle_Graph") -> str:
@@ -103,6 +124,7 @@ class TTR_Task:
         name (str): The new name of the task.
     """
     self.name: str = name
+    self.display_name: str = name.replace(" - ", "\n")
     self.automatic_name: bool = False
 
   def is_empty(self):
@@ -0,0 +1,213 @@
+"""
+This module implements a scrollable list frame that only creates widgets for the rows that are currently visible.
+
+All rows have the same height and are drawn as items on a single canvas: static content like text should be drawn with canvas items (`create_text`, `create_rectangle`, ...), only interactive widgets need to be embedded with `create_window`. All items of a row share the tag `Virtual_List_Frame.get_row_tag(slot)`, so a row can be moved or hidden with a single canvas call.
+While scrolling, rows that leave the visible area are reused for rows that enter it (recycler pattern), so the number of canvas items and widgets only depends on the height of the list, not on the number of rows.
+"""
+import math
+import tkinter as tk
+from typing import Callable, List, Tuple
+
+
+class Virtual_List_Frame(tk.Frame):
+  """A scrollable list of equally high rows that only realizes the visible rows"""
+  def __init__(self,
+      parent: tk.Widget,
+      create_row: Callable[[tk.Canvas, int], None],
+      bind_row: Callable[[int, int], None],
+      resize_rows: Callable[[int], None] = None,
+      row_count: int = 0,
+      row_height: int = None,
+      max_visible_rows: int = 5,
+      overscan: int = 2,
+      scrollbar_kwargs=dict(),
+      canvas_kwargs=dict(),
+      frame_kwargs=dict()):
+    """
+    Create a virtual list frame. Rows are created with `create_row` and filled with the content of a row index with `bind_row`. Call `refresh()` to show the rows.
+
+    Args:
+        parent (tk.Widget): parent widget of the list
+        create_row (Callable[[tk.Canvas, int], None]): draws the items of a new row on the given canvas. The second argument is the slot of the row in the pool of reusable rows. All items of the row must be tagged with `Virtual_List_Frame.get_row_tag(slot)` and placed relative to y=0.
+        bind_row (Callable[[int, int], None]): updates the items of the row in the given slot (first argument) to show the row with the given index (second argument).
+        resize_rows (Callable[[int], None], optional): called with the new width of the canvas whenever it is resized, to move or stretch the items of all rows. Defaults to None.
+        row_count (int, optional): number of rows in the list. Defaults to 0.
+        row_height (int, optional): height of each row in pixels. Defaults to None (measure the height of the first row).
+        max_visible_rows (int, optional): maximum number of rows shown at once. The height of the list is `row_height * min(row_count, max_visible_rows)`. Defaults to 5.
+        overscan (int, optional): number of rows realized in addition to the visible ones. Defaults to 2.
+        scrollbar_kwargs (dict, optional): keyword arguments for the scrollbar. Defaults to dict().
+        canvas_kwargs (dict, optional): keyword arguments for the canvas. Defaults to dict().
+        frame_kwargs (dict, optional): keyword arguments for the frame. Defaults to dict().
+    """
+    super().__init__(parent, **frame_kwargs)
+    self.create_row: Callable[[tk.Canvas, int], None] = create_row
+    self.bind_row: Callable[[int, int], None] = bind_row
+    self.resize_rows: Callable[[int], None] = resize_rows
+    self.row_count: int = row_count
+    self.row_height: int = row_height
+    self.max_visible_rows: int = max_visible_rows
+    self.overscan: int = overscan
+
+    self.canvas = tk.Canvas(self,
+        borderwidth=0,
+        highlightthickness=0,
+        **canvas_kwargs)
+    self.canvas.grid(column=0, row=0, sticky="nsew")
+    self.grid_columnconfigure(0, weight=1)
+    self.vbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview, elementborderwidth=0, relief="flat", **scrollbar_kwargs)
+    self.canvas.configure(yscrollcommand=self._on_yview_change)
+
+    self.row_tags: List[str] = [] # canvas tags of the reusable rows
+    self.row_offsets: List[int] = [] # current y position of each reusable row
+    self.slot_indices: List[int] = [] # index of the row currently shown in each slot (None if the slot is unused)
+    self.canvas_size: Tuple[int, int] = None # total and visible height of the list the canvas was last configured with
+
+    self.canvas.bind("<Configure>", self._on_configure)
+
+  @staticmethod
+  def get_row_tag(slot: int) -> str:
+    """
+    Get the canvas tag shared by all items of the reusable row in the given slot.
+
+    Args:
+        slot (int): slot of the row in the pool of reusable rows
+
+    Returns:
+        str: canvas tag of the row
+    """
+    return f"row_{slot}"
+
+  def refresh(self, row_count: int = None):
+    """
+    Update the size of the list and rebind all realized rows. Call this whenever rows were added, removed or reordered.
+
+    Args:
+        row_count (int, optional): new number of rows. Defaults to None (keep the current number of rows).
+    """
+    if row_count is not None:
+      self.row_count = row_count
+    for slot in range(len(self.slot_indices)):
+      self.slot_indices[slot] = None
+    if self.row_height is None:
+      if self.row_count == 0:
+        return
+      self._measure_row_height()
+    canvas_size: Tuple[int, int] = (self.row_count * self.row_height, self.get_visible_height())
+    # only request a new size if it changed, so the parent's layout is not recalculated on every refresh
+    if canvas_size != self.canvas_size:
+      self.canvas_size = canvas_size
+      self.canvas.configure(
+          scrollregion=(0, 0, 0, canvas_size[0]),
+          height=canvas_size[1],
+          yscrollincrement=self.row_height)
+    self._update_rows()
+    self._hide_or_show_scrollbar()
+
+  def _measure_row_height(self):
+    """Realize the first row and use the size of its items as row height and initial width of the list"""
+    if not self.row_tags:
+      self._add_row_slot()
+    self.bind_row(0, 0)
+    self.slot_indices[0] = 0
+    self.canvas.itemconfigure(self.row_tags[0], state="normal")
+    self.canvas.update_idletasks()
+    x_min, y_min, x_max, y_max = self.canvas.bbox(self.row_tags[0])
+    # rows are placed relative to y=0, so the space above the first item is repeated below the last one
+    self.row_height = max(1, y_max + max(y_min, 0))
+    self.canvas.configure(width=x_max + max(x_min, 0))
+
+  def get_visible_height(self) -> int:
+    """
+    Get the height of the visible part of the list.
+
+    Returns:
+        int: `row_height * min(row_count, max_visible_rows)` in pixels, 0 if the row height is not known yet.
+    """
+    if self.row_height is None:
+      return 0
+    return self.row_height * min(self.row_count, self.max_visible_rows)
+
+  def refresh_row(self, index: int):
+    """
+    Rebind the row with the given index if it is currently realized.
+
+    Args:
+        index (int): index of the row
+    """
+    if not self.row_tags:
+      return
+    slot = index % len(self.row_tags)
+    if self.slot_indices[slot] == index:
+      self.bind_row(slot, index)
+
+  def _on_yview_change(self, first: str, last: str):
+    """Update the scrollbar and the realized rows when the visible part of the list changes"""
+    self.vbar.set(first, last)
+    self._update_rows()
+
+  def _on_configure(self, event: tk.Event):
+    """Stretch all rows to the width of the canvas"""
+    if self.resize_rows is not None:
+      self.resize_rows(event.width)
+    self._update_rows()
+
+  def _add_row_slot(self):
+    """Create a new reusable row"""
+    slot = len(self.row_tags)
+    row_tag = self.get_row_tag(slot)
+    self.create_row(self.canvas, slot)
+    self.canvas.itemconfigure(row_tag, state="hidden")
+    self.row_tags.append(row_tag)
+    self.row_offsets.append(0)
+    self.slot_indices.append(None)
+
+  def _update_rows(self):
+    """Realize all rows that are (almost) visible and hide the remaining reusable rows"""
+    if self.row_height is None:
+      return
+    visible_height = max(self.canvas.winfo_height(), self.get_visible_height())
+    needed_slots = min(math.ceil(visible_height / self.row_height) + 1 + self.overscan, self.row_count)
+    if needed_slots > len(self.row_tags):
+      while len(self.row_tags) < needed_slots:
+        self._add_row_slot()
+      # the mapping from row index to slot depends on the number of slots
+      for slot in range(len(self.slot_indices)):
+        self.slot_indices[slot] = None
+    n_slots = len(self.row_tags)
+    if n_slots == 0:
+      return
+    first_row = max(0, int(self.canvas.canvasy(0) // self.row_height) - self.overscan // 2)
+    last_row = min(first_row + n_slots, self.row_count)
+    shown_slots = set()
+    for index in range(first_row, last_row):
+      slot = index % n_slots
+      shown_slots.add(slot)
+      if self.slot_indices[slot] != index:
+        row_offset: int = index * self.row_height
+        self.canvas.move(self.row_tags[slot], 0, row_offset - self.row_offsets[slot])
+        self.canvas.itemconfigure(self.row_tags[slot], state="normal")
+        self.row_offsets[slot] = row_offset
+        self.slot_indices[slot] = index
+        self.bind_row(slot, index)
+    for slot in range(n_slots):
+      if slot not in shown_slots:
+        self.canvas.itemconfigure(self.row_tags[slot], state="hidden")
+        self.slot_indices[slot] = None
+
+  def _on_mousewheel(self, event: tk.Event):
+    """Scroll the canvas with the mousewheel"""
+    self.canvas.yview_scroll(-1*(event.delta//120), "units")
+
+  def _hide_or_show_scrollbar(self):
+    """Hide or show the scrollbar based on whether the rows fit into the visible part of the list"""
+    if self.row_height is not None and self.row_count > self.max_visible_rows:
+      self.vbar.grid(
+          column=1,
+          row=0,
+          sticky="ens",
+          padx=0,
+          pady=0,)
+      self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    else:
+      self.vbar.grid_forget()
+      self.canvas.yview_moveto(0)